@@ -4,15 +4,20 @@ import logging
 import re
 import shutil
 from pathlib import Path
-from typing import Optional
-from flask import Flask, jsonify, request
+from typing import Optional, Union
+from flask import Flask, Response, jsonify, request, stream_with_context
 from flask_socketio import SocketIO, emit
 from flask_cors import CORS
 from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler
+from watchdog.events import FileSystemEventHandler, EVENT_TYPE_CLOSED
 import threading
 import queue
+import itertools
+import heapq
+import functools
+from collections import OrderedDict, deque
 import os
+import errno
 import signal
 import atexit
 
@@ -21,17 +26,129 @@ logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(
 
 app = Flask(__name__)
 CORS(app, resources={r"/api/*": {"origins": "http://localhost:3000"}})
+# Serialize API responses and Socket.IO packets with orjson when it is installed
+socketio_options = {}
+try:
+    import orjson
+    from flask.json.provider import DefaultJSONProvider
+
+    # Match the stdlib encoder: int keys become strings, and dates are handed
+    # to the fallback instead of orjson's ISO format (Flask renders them as
+    # RFC 822 strings; socketio's stdlib json would reject them)
+    _ORJSON_COMPAT = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+    class ORJSONProvider(DefaultJSONProvider):
+        """Flask JSON provider backed by orjson."""
+
+        def dumps(self, obj, **kwargs):
+            option = _ORJSON_COMPAT
+            if kwargs.get("sort_keys", self.sort_keys):
+                option |= orjson.OPT_SORT_KEYS
+            # Flask's default() covers the types orjson leaves to it (dates,
+            # Decimal, __html__) and raises TypeError for the rest
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    class ORJSONCodec:
+        """Stdlib-compatible dumps/loads shim for python-socketio packets."""
+
+        @staticmethod
+        def dumps(obj, **kwargs):
+            return orjson.dumps(obj, default=kwargs.get("default"), option=_ORJSON_COMPAT).decode()
+
+        @staticmethod
+        def loads(s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = ORJSONProvider(app)
+    socketio_options["json"] = ORJSONCodec
+except ImportError:
+    pass
 # Try using eventlet for better async handling, fallback to threading
 try:
     import eventlet
-    socketio = SocketIO(app, cors_allowed_origins="http://localhost:3000", async_mode='eventlet')
+    socketio = SocketIO(app, cors_allowed_origins="http://localhost:3000", async_mode='eventlet', **socketio_options)
     print("Using eventlet async mode")
 except ImportError:
-    socketio = SocketIO(app, cors_allowed_origins="http://localhost:3000", async_mode='threading')
+    socketio = SocketIO(app, cors_allowed_origins="http://localhost:3000", async_mode='threading', **socketio_options)
     print("Using threading async mode")
 
 # --- In-Memory State Management ---
-STATE = {
+
+class EventChannel:
+    """Event queue for the file processor: many producers, a single consumer.
+
+    deque.append/popleft are atomic, so producers never take a lock; a
+    threading.Event only wakes the consumer when the queue was empty.
+    """
+
+    def __init__(self):
+        self._items = deque()
+        self._ready = threading.Event()
+
+    def put(self, item):
+        self._items.append(item)
+        self._ready.set()
+
+    def get(self, timeout: Optional[float] = None):
+        """Removes and returns the oldest item, raising queue.Empty on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                return self._items.popleft()
+            except IndexError:
+                pass
+            self._ready.clear()
+            # An item may have arrived between popleft() and clear()
+            if self._items:
+                continue
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                raise queue.Empty
+            self._ready.wait(remaining)
+
+    def get_nowait(self):
+        try:
+            return self._items.popleft()
+        except IndexError:
+            raise queue.Empty
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def clear(self):
+        """Drops every queued item in one call."""
+        self._items.clear()
+        self._ready.clear()
+
+    def empty(self) -> bool:
+        return not self._items
+
+# Fields reported by get_status_data(); writing any of them invalidates its cache
+_STATUS_FIELDS = frozenset({"status", "start_time", "files_processed_today", "queue_size", "last_error"})
+_status_versions = itertools.count(1)
+
+class StateDict(dict):
+    """STATE container that bumps `version` whenever a status field changes.
+
+    Versions come from a shared counter, so concurrent writers never reuse a
+    value a reader may already have cached against.
+    """
+
+    version = 0
+
+    def __setitem__(self, key, value):
+        if key in _STATUS_FIELDS:
+            changed = self.get(key) != value
+            super().__setitem__(key, value)
+            if changed:
+                self.version = next(_status_versions)
+        else:
+            super().__setitem__(key, value)
+
+STATE = StateDict({
     "status": "stopped",  # running, stopped, error
     "start_time": None,
     "config": {
@@ -43,44 +160,97 @@ STATE = {
         "filename_pattern": r'^(?P<doc>.+?)_(?P<client>.+?)_(?P<date>\d{4}-?\d{2}-?\d{2})_(?P<status>.+?)\.pdf$',
         "log_level": "INFO",
     },
-    "recent_files": [],
-    "logs": [],
+    # Bounded, newest-first; appendleft is atomic so no lock is needed
+    "recent_files": deque(maxlen=100),
+    "logs": deque(maxlen=1000),
     "last_error": None,
     "files_processed_today": 0,
     "queue_size": 0,
     "observer_thread": None,
-    "event_queue": queue.Queue(),
-}
+    "event_queue": EventChannel(),
+})
 
 # Add thread safety lock
 STATE_LOCK = threading.Lock()
 
 # --- Core Logic from practice.py ---
 
+# Precompiled patterns; the filename pattern is rebuilt whenever the config changes
+_INVALID_CHARS = re.compile(r'[<>:"/\\|?*]')
+_WHITESPACE = re.compile(r'\s+')
+
+def _build_filename_pattern(pattern: str) -> re.Pattern:
+    return re.compile(pattern, re.IGNORECASE)
+
+_COMPILED_PATTERN = _build_filename_pattern(STATE["config"]["filename_pattern"])
+
+def _build_keyword_re(keywords) -> re.Pattern:
+    # An empty alternation would match everything; (?!) never matches
+    if not keywords:
+        return re.compile(r'(?!)')
+    return re.compile('|'.join(re.escape(k) for k in keywords), re.IGNORECASE)
+
+def _build_status_re(keywords) -> re.Pattern:
+    # One zero-width probe per position, so overlapping hits are all seen; at a
+    # given position the _signed tag beats "unsigned", which beats a keyword
+    keyword = '|'.join(re.escape(k) for k in keywords) if keywords else r'(?!)'
+    return re.compile(
+        r'(?=(?P<tag>_signed)|(?P<unsigned>unsigned)|(?P<keyword>%s))' % keyword,
+        re.IGNORECASE,
+    )
+
+_KEYWORD_RE = _build_keyword_re(STATE["config"]["status_keywords"])
+_STATUS_RE = _build_status_re(STATE["config"]["status_keywords"])
+
 class FilenameParser:
     """Parses PDF filenames according to the specified pattern."""
 
     @staticmethod
-    def parse_filename(filename: str) -> Optional[dict]:
-        pattern = re.compile(STATE["config"]["filename_pattern"], re.IGNORECASE)
-        match = pattern.match(filename)
+    def parse_filename(filename: str, pattern: Optional[re.Pattern] = None) -> Optional[dict]:
+        match = (pattern or _COMPILED_PATTERN).match(filename)
         if not match:
             return None
         return match.groupdict()
 
     @staticmethod
-    def is_signed_status(status: str) -> bool:
+    def parse_signed(filename: str) -> tuple[Optional[dict], bool]:
+        """Parses the filename and checks its status in a single call.
+
+        The status is classified in place, over the status group's span of
+        the filename, with one scan that finds the _signed tag, "unsigned"
+        and the keywords together (same result as is_signed_status).
+        """
+        match = _COMPILED_PATTERN.match(filename)
+        if not match:
+            return None, False
+        parsed = match.groupdict()
+        if not parsed.get('status'):
+            return parsed, False
+        signed = unsigned = False
+        for hit in _STATUS_RE.finditer(filename, match.start('status'), match.end('status')):
+            kind = hit.lastgroup
+            if kind == 'tag':
+                return parsed, True
+            if kind == 'unsigned':
+                unsigned = True
+            else:
+                signed = True
+        return parsed, signed and not unsigned
+
+    @staticmethod
+    def is_signed_status(status: str, keyword_re: Optional[re.Pattern] = None) -> bool:
         status_lower = status.lower()
         if '_signed' in status_lower:
             return True
         if 'unsigned' in status_lower:
             return False
-        return any(indicator in status_lower for indicator in STATE["config"]["status_keywords"])
+        return (keyword_re or _KEYWORD_RE).search(status_lower) is not None
 
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def normalize_path_segment(segment: str) -> str:
-        normalized = re.sub(r'[<>:"/\\|?*]', '', segment)
-        normalized = re.sub(r'\s+', '_', normalized)
+        normalized = _INVALID_CHARS.sub('', segment)
+        normalized = _WHITESPACE.sub('_', normalized)
         return normalized.strip('_.')
 
 class FileStabilityChecker:
@@ -90,8 +260,11 @@ class FileStabilityChecker:
         self.timeout = timeout
         self.check_interval = check_interval
 
-    def wait_for_stability(self, filepath: Path) -> bool:
-        if not filepath.exists():
+    def wait_for_stability(self, filepath: Union[str, Path]) -> bool:
+        # Debounced created/modified events reach this on every platform, so
+        # the quiet window is the baseline one: short timeouts need two samples.
+        path = str(filepath)
+        if not os.path.exists(path):
             return False
         
         start_time = time.time()
@@ -103,7 +276,7 @@ class FileStabilityChecker:
 
         while time.time() - start_time < self.timeout:
             try:
-                stat = filepath.stat()
+                stat = os.stat(path)
                 current_size = stat.st_size
                 mtime = stat.st_mtime
                 size_stable = current_size == last_size and current_size > 0
@@ -126,83 +299,185 @@ class FileStabilityChecker:
 
         return False
 
+# Upper bound on destination directories PDFMover remembers as already created
+ENSURED_DIRS_MAX = 1024
+
 class PDFMover:
     """Handles moving PDFs to destination folders with duplicate handling."""
 
-    def __init__(self, dest_root: Path, dry_run: bool = False):
-        self.dest_root = Path(dest_root)
+    def __init__(self, dest_root: Union[str, Path], dry_run: bool = False,
+                 workplace_path: Optional[Union[str, Path]] = None):
+        # Kept as a plain string; destinations are built with os.path.join
+        self.dest_root = os.fspath(dest_root)
         self.dry_run = dry_run
         self.logger = logging.getLogger(__name__)
+        # Bounded LRU of destination directories already created by this mover
+        self._ensured_dirs = OrderedDict()
+        # Same device lets a move be a single atomic rename
+        self._same_fs = workplace_path is not None and self._same_device(workplace_path, self.dest_root)
+
+    @staticmethod
+    def _same_device(a: Union[str, Path], b: Union[str, Path]) -> bool:
+        # The destination root may not exist yet; compare its nearest existing ancestor
+        b = os.path.abspath(b)
+        while not os.path.exists(b) and os.path.dirname(b) != b:
+            b = os.path.dirname(b)
+        try:
+            return os.stat(a).st_dev == os.stat(b).st_dev
+        except OSError:
+            return False
+
+    def _ensure_dir(self, dest_dir: str):
+        if dest_dir in self._ensured_dirs:
+            self._ensured_dirs.move_to_end(dest_dir)
+            return
+        os.makedirs(dest_dir, exist_ok=True)
+        self._ensured_dirs[dest_dir] = None
+        if len(self._ensured_dirs) > ENSURED_DIRS_MAX:
+            self._ensured_dirs.popitem(last=False)
+
+    def _move(self, source: str, dest_file: str):
+        if self._same_fs:
+            try:
+                os.replace(source, dest_file)
+                return
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+        shutil.move(source, dest_file)
 
-    def move_signed_pdf(self, source_path: Path, parsed_info: dict) -> Optional[Path]:
+    def move_signed_pdf(self, source_path: Union[str, Path], parsed_info: dict) -> Optional[str]:
+        source = os.fspath(source_path)
         try:
             form_dir = FilenameParser.normalize_path_segment(parsed_info['doc'])
             client_dir = FilenameParser.normalize_path_segment(parsed_info['client'])
             date_dir = FilenameParser.normalize_path_segment(parsed_info['date'])
             status_dir = FilenameParser.normalize_path_segment(parsed_info['status'])
             
-            dest_dir = self.dest_root / form_dir / client_dir / date_dir / status_dir
-            dest_file = dest_dir / source_path.name
+            dest_dir = os.path.join(self.dest_root, form_dir, client_dir, date_dir, status_dir)
+            name = os.path.basename(source)
+            dest_file = os.path.join(dest_dir, name)
             
-            if dest_file.exists():
+            if os.path.exists(dest_file):
                 timestamp = int(time.time())
-                stem = dest_file.stem
-                suffix = dest_file.suffix
-                dest_file = dest_dir / f"{stem}_{timestamp}{suffix}"
+                stem, suffix = os.path.splitext(name)
+                dest_file = os.path.join(dest_dir, f"{stem}_{timestamp}{suffix}")
             
             if self.dry_run:
-                self.logger.info(f"[DRY RUN] Would move: {source_path} -> {dest_file}")
+                self.logger.info(f"[DRY RUN] Would move: {source} -> {dest_file}")
                 return dest_file
             
-            dest_dir.mkdir(parents=True, exist_ok=True)
-            shutil.move(str(source_path), str(dest_file))
-            self.logger.info(f"Moved: {source_path} -> {dest_file}")
+            self._ensure_dir(dest_dir)
+            try:
+                self._move(source, dest_file)
+            except FileNotFoundError:
+                # The cached directory may have been removed behind our back
+                if not os.path.exists(source):
+                    raise
+                self._ensured_dirs.pop(dest_dir, None)
+                self._ensure_dir(dest_dir)
+                self._move(source, dest_file)
+            self.logger.info(f"Moved: {source} -> {dest_file}")
             return dest_file
             
         except Exception as e:
-            self.logger.error(f"Failed to move {source_path}: {e}")
+            self.logger.error(f"Failed to move {source}: {e}")
             return None
 
+# Quiet period before a file's burst of create/modify events is handed to the processor
+EVENT_DEBOUNCE_SECONDS = 0.3
+
 class MyHandler(FileSystemEventHandler):
-    def __init__(self, event_queue: queue.Queue):
+    def __init__(self, event_queue: EventChannel, debounce_seconds: float = EVENT_DEBOUNCE_SECONDS):
         self.event_queue = event_queue
+        # Raw event.src_path strings of files queued or being processed
         self.processing = set()
         self.processing_lock = threading.Lock()
+        self.debounce_seconds = debounce_seconds
+        # One worker thread flushes all paths: path -> (deadline, latest event),
+        # plus a min-heap of (deadline, path); heap entries whose deadline no
+        # longer matches were rescheduled and are skipped when popped
+        self.pending = {}
+        self._heap = []
+        self._cond = threading.Condition()
+        self._worker = None
+        self._cancelled = False
 
     def _queue_event_if_pdf(self, event):
         if event.is_directory:
             return
-        try:
-            p = Path(event.src_path)
-        except Exception:
+        # Keyed by the raw path string; no Path construction or hashing per event
+        p = event.src_path
+        if not isinstance(p, str):
             return
+        name = os.path.basename(p)
         # Only accept real .pdf files, ignore temp/partial/dotfiles
-        if p.suffix.lower() != '.pdf':
-            return
-        if p.name.startswith('.') or p.name.endswith('.part') or p.name.endswith('~'):
+        if not name.lower().endswith('.pdf') or name.startswith('.'):
             return
 
-        if p in self.processing:
-            return
+        # Push the path's deadline back so a burst of events yields one enqueue
+        with self._cond:
+            if self._cancelled:
+                return
+            deadline = time.monotonic() + self.debounce_seconds
+            self.pending[p] = (deadline, event)
+            heapq.heappush(self._heap, (deadline, p))
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._drain, name='pdf-event-debounce', daemon=True
+                )
+                self._worker.start()
+            self._cond.notify()
+
+    def _drain(self):
+        """Worker loop: enqueue each path's latest event after its quiet period."""
+        while True:
+            with self._cond:
+                while not self._heap and not self._cancelled:
+                    self._cond.wait()
+                if self._cancelled:
+                    return
+                now = time.monotonic()
+                ready = []
+                while self._heap and self._heap[0][0] <= now:
+                    deadline, p = heapq.heappop(self._heap)
+                    entry = self.pending.get(p)
+                    if entry is not None and entry[0] == deadline:
+                        del self.pending[p]
+                        ready.append((p, entry[1]))
+                if not ready:
+                    if self._heap:
+                        self._cond.wait(self._heap[0][0] - now)
+                    continue
+            for p, event in ready:
+                self._flush(p, event)
+
+    def _flush(self, p: str, event):
         with self.processing_lock:
             if p in self.processing:
                 return
             self.processing.add(p)
             self.event_queue.put(event)
 
-        self.processing.add(p)
-        self.event_queue.put(event)
-        # update shared queue size and broadcast (with thread safety)
-        with STATE_LOCK:
-            STATE["queue_size"] = self.event_queue.qsize()
-        try:
-            socketio.emit('status_update', get_status_data())
-        except Exception as e:
-            logging.warning(f"Failed to emit status update: {e}")
+        # update shared queue size and broadcast
+        STATE["queue_size"] = self.event_queue.qsize()
+        throttled_status_emit()
+
+    def cancel_pending(self):
+        """Drop events still waiting out their debounce period and end the worker."""
+        with self._cond:
+            self._cancelled = True
+            self.pending.clear()
+            self._heap.clear()
+            self._cond.notify()
 
     def on_created(self, event):
         self._queue_event_if_pdf(event)
 
+    def on_closed(self, event):
+        # inotify IN_CLOSE_WRITE: the writer is done, no stability polling needed
+        self._queue_event_if_pdf(event)
+
     def on_modified(self, event):
         self._queue_event_if_pdf(event)
 
@@ -213,23 +488,44 @@ class MyHandler(FileSystemEventHandler):
 
 # --- Helper Functions ---
 
+# (epoch second, formatted prefix) reused by _format_ts within the same second
+_ts_prefix = (None, "")
+
+def _format_ts(ns: int) -> str:
+    """Formats a time.time_ns() value as an ISO-8601 UTC timestamp."""
+    global _ts_prefix
+    seconds, remainder = divmod(ns, 1_000_000_000)
+    cached_seconds, prefix = _ts_prefix
+    if cached_seconds != seconds:
+        prefix = time.strftime('%Y-%m-%dT%H:%M:%S', time.gmtime(seconds))
+        _ts_prefix = (seconds, prefix)
+    return f"{prefix}.{remainder // 1000:06d}+00:00"
+
+def _safe_emit(event, data):
+    """Emits to all clients from any thread.
+
+    Under eventlet the emit is scheduled on the hub, since plain worker threads
+    cannot switch into it; in threading mode it is sent directly.
+    """
+    if socketio.async_mode == 'threading':
+        socketio.emit(event, data)
+    else:
+        socketio.start_background_task(socketio.emit, event, data)
+
 def add_log(level, message, file_path=None):
     """Helper to add a new log entry."""
     entry = {
-        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "timestamp": _format_ts(time.time_ns()),
         "level": level,
         "message": message,
         "module": "server",
         "file_path": file_path
     }
-    with STATE_LOCK:
-        STATE["logs"].insert(0, entry)
-        if len(STATE["logs"]) > 1000:
-            STATE["logs"].pop()
+    STATE["logs"].appendleft(entry)
     
     logging.info(f"LOG [{level}]: {message}")
     try:
-        socketio.emit('log_update', entry)
+        _safe_emit('log_update', entry)
     except Exception as e:
         logging.warning(f"Failed to emit log update: {e}")
 
@@ -237,104 +533,160 @@ def broadcast_status():
     """Emits the current service status to all connected clients."""
     try:
         status_data = get_status_data()
-        socketio.emit('status_update', status_data)
+        _safe_emit('status_update', status_data)
         logging.info(f"Broadcasted status update: {status_data['status']}")
     except Exception as e:
         logging.warning(f"Failed to broadcast status: {e}")
 
+# Minimum spacing between status_update emits triggered by file activity
+STATUS_EMIT_INTERVAL = 0.25
+_status_emit_lock = threading.Lock()
+_last_status_emit = 0.0
+_status_emit_pending = False
+
+def _emit_status():
+    try:
+        _safe_emit('status_update', get_status_data())
+    except Exception as e:
+        logging.warning(f"Failed to emit status update: {e}")
+
+def _emit_pending_status():
+    global _last_status_emit, _status_emit_pending
+    with _status_emit_lock:
+        _status_emit_pending = False
+        _last_status_emit = time.monotonic()
+    _emit_status()
+
+def throttled_status_emit():
+    """Emits a status update at most once per STATUS_EMIT_INTERVAL.
+
+    Calls inside the interval are collapsed into one trailing emit, which
+    reads the status at the time it fires.
+    """
+    global _last_status_emit, _status_emit_pending
+    with _status_emit_lock:
+        if _status_emit_pending:
+            return
+        now = time.monotonic()
+        delay = _last_status_emit + STATUS_EMIT_INTERVAL - now
+        if delay > 0:
+            _status_emit_pending = True
+            timer = threading.Timer(delay, _emit_pending_status)
+            timer.daemon = True
+            timer.start()
+            return
+        _last_status_emit = now
+    _emit_status()
+
+# (state version, uptime, payload) of the last status dictionary built
+_status_cache = (None, None, None)
+
 def get_status_data():
-    """Constructs the status dictionary."""
+    """Constructs the status dictionary.
+
+    The result is reused until a status field changes or the uptime ticks over,
+    so callers must treat it as read-only.
+    """
+    global _status_cache
+    version = STATE.version
     uptime = 0
     if STATE["status"] == "running" and STATE["start_time"]:
         uptime = int(time.time() - STATE["start_time"])
-    
-    return {
+
+    cached_version, cached_uptime, data = _status_cache
+    if cached_version == version and cached_uptime == uptime:
+        return data
+
+    data = {
         "status": STATE["status"],
         "uptime_seconds": uptime,
         "files_processed_today": STATE["files_processed_today"],
         "queue_size": STATE["queue_size"],
         "last_error": STATE["last_error"],
     }
+    _status_cache = (version, uptime, data)
+    return data
 
 def file_processor_thread():
+    # Config changes require a restart, so snapshot everything used per event
     config = STATE['config']
     stability_checker = FileStabilityChecker(timeout=config['stability_wait_seconds'])
-    mover = PDFMover(Path(config['destination_root']), dry_run=config['dry_run_mode'])
-    
+    mover = PDFMover(config['destination_root'], dry_run=config['dry_run_mode'],
+                     workplace_path=config['workplace_path'])
+    pattern = _COMPILED_PATTERN
+    keyword_re = _KEYWORD_RE
+    parse_filename = FilenameParser.parse_filename
+    is_signed_status = FilenameParser.is_signed_status
+
     while STATE['status'] == 'running':
         try:
             event = STATE['event_queue'].get(timeout=1)
-            # update queue size after removing item (with thread safety)
-            with STATE_LOCK:
-                STATE["queue_size"] = STATE['event_queue'].qsize()
+            # update queue size after removing item
+            STATE["queue_size"] = STATE['event_queue'].qsize()
             
-            filepath = Path(event.src_path)
+            # Plain strings throughout; no Path objects on the per-file path
+            src = event.src_path
+            name = os.path.basename(src)
             
             try:
-                if filepath.suffix.lower() != '.pdf':
+                if not name.lower().endswith('.pdf'):
                     continue
 
-                add_log("INFO", f"Processing file: {filepath}", file_path=str(filepath))
+                add_log("INFO", f"Processing file: {src}", file_path=src)
                 
                 try:
-                    stat_info = filepath.stat()
+                    stat_info = os.stat(src)
                 except FileNotFoundError:
-                    add_log("WARNING", f"File not found: {filepath}", file_path=str(filepath))
+                    add_log("WARNING", f"File not found: {src}", file_path=src)
                     continue
 
-                parsed_info = FilenameParser.parse_filename(filepath.name)
+                parsed_info = parse_filename(name, pattern)
                 if not parsed_info:
-                    add_log("INFO", f"Filename doesn't match pattern: {filepath.name}", file_path=str(filepath))
+                    add_log("INFO", f"Filename doesn't match pattern: {name}", file_path=src)
                     continue
                 
-                if not FilenameParser.is_signed_status(parsed_info['status']):
-                    add_log("INFO", f"Document not signed, ignoring: {filepath.name}", file_path=str(filepath))
+                if not is_signed_status(parsed_info['status'], keyword_re):
+                    add_log("INFO", f"Document not signed, ignoring: {name}", file_path=src)
                     continue
                 
-                add_log("INFO", f"Found signed document: {filepath.name}", file_path=str(filepath))
+                add_log("INFO", f"Found signed document: {name}", file_path=src)
                 
-                if not stability_checker.wait_for_stability(filepath):
-                    add_log("WARNING", f"File did not stabilize within timeout: {filepath}", file_path=str(filepath))
+                if event.event_type != EVENT_TYPE_CLOSED and not stability_checker.wait_for_stability(src):
+                    add_log("WARNING", f"File did not stabilize within timeout: {src}", file_path=src)
                     continue
                 
-                destination_path = mover.move_signed_pdf(filepath, parsed_info)
+                destination_path = mover.move_signed_pdf(src, parsed_info)
                 
                 status = "processed" if destination_path else "failed"
                 error_message = None if destination_path else "Failed to move file"
 
                 file_info = {
-                    "id": str(filepath.name),
-                    "original_path": str(filepath),
-                    "destination_path": str(destination_path) if destination_path else None,
+                    "id": name,
+                    "original_path": src,
+                    "destination_path": destination_path,
                     "status": status,
-                    "processed_at": datetime.now(timezone.utc).isoformat(),
-                    "detected_at": datetime.fromtimestamp(stat_info.st_ctime, tz=timezone.utc).isoformat(),
+                    "processed_at": _format_ts(time.time_ns()),
+                    "detected_at": _format_ts(stat_info.st_ctime_ns),
                     "file_size_bytes": stat_info.st_size,
                     "error_message": error_message,
                     "parsed_metadata": parsed_info
                 }
-                with STATE_LOCK:
-                    STATE["recent_files"].insert(0, file_info)
-                    if len(STATE["recent_files"]) > 100:
-                        STATE["recent_files"].pop()
+                STATE["recent_files"].appendleft(file_info)
                 
                 try:
-                    socketio.emit('file.processed', file_info)
+                    _safe_emit('file.processed', file_info)
                 except Exception as e:
                     logging.warning(f"Failed to emit file processed event: {e}")
                 
                 if destination_path:
                     with STATE_LOCK:
                         STATE["files_processed_today"] += 1
-                    broadcast_status()
+                    throttled_status_emit()
             finally:
                 handler = STATE.get('event_handler')
                 if handler and isinstance(handler, MyHandler):
-                    if filepath in handler.processing:
-                        handler.processing.remove(filepath)
-                    with handler.processing_lock:
-                        if filepath in handler.processing:
-                            handler.processing.remove(filepath)
+                    # set.discard is atomic and tolerates a missing key; no lock needed
+                    handler.processing.discard(src)
         except queue.Empty:
             continue
         except Exception as e:
@@ -485,6 +837,10 @@ def stop_service():
             add_log("INFO", "Stopping file system observer...")
             observer.stop()
             observer.join(timeout=5) # Wait for observer to terminate
+
+        handler = STATE.get('event_handler')
+        if handler and isinstance(handler, MyHandler):
+            handler.cancel_pending()
         
         if processor_thread and processor_thread.is_alive():
             add_log("INFO", "Waiting for file processor to finish...")
@@ -521,11 +877,7 @@ def force_reset():
         STATE['observer_thread'] = None
         
         # Clear the event queue
-        while not STATE['event_queue'].empty():
-            try:
-                STATE['event_queue'].get_nowait()
-            except:
-                break
+        STATE['event_queue'].clear()
         
         add_log("INFO", "Service state force reset")
         return jsonify({"message": "Service state reset successfully"})
@@ -541,7 +893,21 @@ def handle_config():
         if not new_config:
             return jsonify({"error": "Invalid configuration data"}), 400
         
-        STATE["config"].update(new_config)
+        global _COMPILED_PATTERN, _KEYWORD_RE, _STATUS_RE
+        with STATE_LOCK:
+            # Build everything first so a rejected config installs nothing
+            pattern, keyword_re, status_re = _COMPILED_PATTERN, _KEYWORD_RE, _STATUS_RE
+            try:
+                if 'filename_pattern' in new_config:
+                    pattern = _build_filename_pattern(new_config['filename_pattern'])
+                if 'status_keywords' in new_config:
+                    keyword_re = _build_keyword_re(new_config['status_keywords'])
+                    status_re = _build_status_re(new_config['status_keywords'])
+            except (re.error, TypeError) as e:
+                return jsonify({"error": f"Invalid configuration data: {e}"}), 400
+            
+            _COMPILED_PATTERN, _KEYWORD_RE, _STATUS_RE = pattern, keyword_re, status_re
+            STATE["config"].update(new_config)
         add_log("INFO", "Configuration updated.")
         return jsonify({"message": "Configuration updated successfully", "restart_required": True})
     else: # GET
@@ -549,66 +915,74 @@ def handle_config():
 
 @app.route('/api/v1/files/recent', methods=['GET'])
 def get_recent_files():
-    return jsonify({"files": STATE["recent_files"], "total": len(STATE["recent_files"])
+    return jsonify({"files": list(STATE["recent_files"]), "total": len(STATE["recent_files"])
 , "has_more": False})
 
 @app.route('/api/v1/files/preview', methods=['GET'])
 def get_file_preview():
     config = STATE['config']
-    workplace_path = Path(config['workplace_path'])
-    preview_results = []
-    total_files = 0
-    would_process = 0
-    would_skip = 0
-
-    if workplace_path.exists() and workplace_path.is_dir():
-        for file_path in workplace_path.iterdir():
-            if not file_path.is_file():
-                continue
-
-            total_files += 1
-
-            if file_path.suffix.lower() == '.pdf':
-                parsed = FilenameParser.parse_filename(file_path.name)
-                
-                if parsed and FilenameParser.is_signed_status(parsed.get('status', '')):
-                    would_process += 1
-                    preview_results.append({
-                        "file_path": str(file_path),
-                        "would_process": True,
-                        "reason": "Matches pattern and contains signed status",
-                        "parsed_metadata": parsed
-                    })
-                else:
-                    would_skip += 1
-                    preview_results.append({
-                        "file_path": str(file_path),
-                        "would_process": False,
-                        "reason": "No signed status keyword found" if parsed else "Filename doesn't match pattern",
-                        "parsed_metadata": parsed
-                    })
-            else:
-                would_skip += 1
-                preview_results.append({
-                    "file_path": str(file_path),
-                    "would_process": False,
-                    "reason": "Non-PDF file, skipped",
-                    "parsed_metadata": None
-                })
-
-    return jsonify({
-        "files": preview_results,
-        "summary": {
+    workplace_path = config['workplace_path']
+    # Opened eagerly so scandir errors still fail the request before streaming starts
+    entries = os.scandir(workplace_path) if os.path.isdir(workplace_path) else None
+    parse_signed = FilenameParser.parse_signed
+    dumps = app.json.dumps
+
+    def generate():
+        # Entries are serialized as they are scanned; the summary closes the document
+        total_files = 0
+        would_process = 0
+        would_skip = 0
+        yield '{"files":['
+        if entries is not None:
+            with entries:
+                for entry in entries:
+                    if not entry.is_file(follow_symlinks=False):
+                        continue
+
+                    if total_files:
+                        yield ','
+                    total_files += 1
+
+                    if entry.name.lower().endswith('.pdf'):
+                        parsed, signed = parse_signed(entry.name)
+
+                        if signed:
+                            would_process += 1
+                            yield dumps({
+                                "file_path": entry.path,
+                                "would_process": True,
+                                "reason": "Matches pattern and contains signed status",
+                                "parsed_metadata": parsed
+                            })
+                        else:
+                            would_skip += 1
+                            yield dumps({
+                                "file_path": entry.path,
+                                "would_process": False,
+                                "reason": "No signed status keyword found" if parsed else "Filename doesn't match pattern",
+                                "parsed_metadata": parsed
+                            })
+                    else:
+                        would_skip += 1
+                        yield dumps({
+                            "file_path": entry.path,
+                            "would_process": False,
+                            "reason": "Non-PDF file, skipped",
+                            "parsed_metadata": None
+                        })
+
+        yield '],"summary":' + dumps({
             "total_files": total_files,
             "would_process": would_process,
             "would_skip": would_skip,
             "conflicts": 0
-        }
-    })
+        }) + '}'
+
+    return Response(stream_with_context(generate()), mimetype='application/json')
 
 @app.route('/api/v1/logs', methods=['GET'])
 def get_logs():
-    return jsonify({"logs": STATE["logs"], "total": len(STATE["logs"])
+    return jsonify({"logs": list(STATE["logs"]), "total": len(STATE["logs"])
 , "has_more": False})
 
 @app.route('/health', methods=['GET'])
@@ -678,6 +1052,10 @@ def test_file_rename():
         add_log("ERROR", error_msg)
         return jsonify({"success": False, "error": error_msg}), 500
 
+def _count_pdfs(directory) -> int:
+    with os.scandir(directory) as entries:
+        return sum(1 for e in entries if e.is_file() and e.name.endswith('.pdf'))
+
 @app.route('/api/v1/test/create-sample', methods=['POST'])
 def create_sample_files():
     """Create sample files for testing."""
@@ -721,7 +1099,7 @@ def create_sample_files():
             "created_files": created_files,
             "existing_files": existing_files,
             "workplace_path": str(workplace),
-            "total_files": len(list(workplace.glob("*.pdf")))
+            "total_files": _count_pdfs(workplace)
         })
         
     except Exception as e:
@@ -3,25 +3,40 @@
 Test script to verify file modification detection and processing.
 """
 import requests
+from requests.adapters import HTTPAdapter
 import json
+import os
 import time
 from pathlib import Path
 
 BASE_URL = "http://localhost:8080"
+# VERBOSE=0 skips pretty-printing response bodies
+VERBOSE = os.environ.get("VERBOSE", "1") != "0"
 
-def test_api(endpoint, method="GET", data=None):
-    """Helper function to test API endpoints."""
+# One keep-alive connection pool for every request the script makes
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=10))
+
+def test_api(endpoint, method="GET", data=None, verbose=VERBOSE, want_body=True):
+    """Helper function to test API endpoints.
+
+    With want_body=False and verbose off, the body is not parsed and True is
+    returned on success.
+    """
     url = f"{BASE_URL}{endpoint}"
     try:
         if method == "POST":
-            response = requests.post(url, json=data, headers={"Content-Type": "application/json"})
+            response = SESSION.post(url, json=data)
         else:
-            response = requests.get(url)
+            response = SESSION.get(url)
         
         print(f"{method} {endpoint}: {response.status_code}")
         if response.status_code == 200:
+            if not (verbose or want_body):
+                return True
             result = response.json()
-            print(f"Response: {json.dumps(result, indent=2)}")
+            if verbose:
+                print(f"Response: {json.dumps(result, indent=2)}")
             return result
         else:
             print(f"Error: {response.text}")
@@ -30,6 +45,12 @@ def test_api(endpoint, method="GET", data=None):
         print(f"Request failed: {e}")
         return None
 
+def iter_files(root):
+    """Yields file paths under root; os.walk reads dirent types via scandir."""
+    for dirpath, _dirnames, filenames in os.walk(root):
+        for name in filenames:
+            yield os.path.join(dirpath, name)
+
 def main():
     print("=== Testing File Modification Detection ===\n")
     
@@ -42,22 +63,22 @@ def main():
     
     # 2. Create sample files
     print("\n2. Creating sample files...")
-    test_api("/api/v1/test/create-sample", "POST")
+    test_api("/api/v1/test/create-sample", "POST", want_body=False)
     
     # 3. Check preview before starting service
     print("\n3. Checking file preview...")
-    test_api("/api/v1/files/preview")
+    test_api("/api/v1/files/preview", want_body=False)
     
     # 4. Start the service
     print("\n4. Starting file monitoring service...")
-    start_result = test_api("/api/v1/start", "POST")
+    test_api("/api/v1/start", "POST", want_body=False)
     
     # 5. Wait a moment for service to start
     time.sleep(2)
     
     # 6. Check service status
     print("\n5. Checking service status...")
-    test_api("/api/v1/status")
+    test_api("/api/v1/status", want_body=False)
     
     # 7. Test file rename
     print("\n6. Testing file rename...")
@@ -65,7 +86,7 @@ def main():
         "original_name": "test_document.pdf",
         "new_name": "Contract_TestClient_2024-01-15_signed.pdf"
     }
-    test_api("/api/v1/test/rename", "POST", rename_data)
+    test_api("/api/v1/test/rename", "POST", rename_data, want_body=False)
     
     # 8. Wait for processing
     print("\n7. Waiting for file processing...")
@@ -73,22 +94,24 @@ def main():
     
     # 9. Check recent files
     print("\n8. Checking recently processed files...")
-    test_api("/api/v1/files/recent")
+    test_api("/api/v1/files/recent", want_body=False)
     
     # 10. Check logs
     print("\n9. Checking logs...")
-    test_api("/api/v1/logs")
+    test_api("/api/v1/logs", want_body=False)
     
     # 11. Check if file was moved to destination
     print("\n10. Checking destination directory...")
     dest_path = Path("/tmp/destination")
     if dest_path.exists():
         print(f"Destination directory contents:")
-        for item in dest_path.rglob("*"):
-            if item.is_file():
-                print(f"  {item}")
+        for item in iter_files(dest_path):
+            print(f"  {item}")
     else:
         print("Destination directory doesn't exist yet")
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        SESSION.close()
@@ -1,9 +1,16 @@
 import time
 import logging
+import errno
+import functools
+import os
 import re
 import shutil
+import signal
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Union
 from watchdog.observers import Observer
 from watchdog.events import FileSystemEventHandler
 
@@ -22,31 +29,95 @@ STATE = {
     },
 }
 
+# Compiled once; practice.py never changes its config at runtime
+_INVALID_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+_COMPILED_PATTERN = re.compile(STATE["config"]["filename_pattern"], re.IGNORECASE)
+# Single-pass substring match over all status keywords; (?!) never matches
+_KEYWORD_RE = re.compile(
+    '|'.join(re.escape(k) for k in STATE["config"]["status_keywords"]) or r'(?!)',
+    re.IGNORECASE,
+)
+
+# The default pattern is parsed by _split_filename; a custom one falls back to the regex
+_DEFAULT_FILENAME_PATTERN = r'^(?P<doc>.+?)_(?P<client>.+?)_(?P<date>\d{4}-?\d{2}-?\d{2})_(?P<status>.+?)\.pdf$'
+USE_SPLIT_PARSER = STATE["config"]["filename_pattern"] == _DEFAULT_FILENAME_PATTERN
+
+def _date_end(stem: str, i: int) -> int:
+    """Returns the index just past an NNNN[-]NN[-]NN token starting at i, or -1."""
+    j = i + 4
+    if len(stem) < j or not stem[i:j].isdecimal():
+        return -1
+    for _ in range(2):
+        if stem.startswith('-', j):
+            j += 1
+        if len(stem) < j + 2 or not stem[j:j + 2].isdecimal():
+            return -1
+        j += 2
+    return j
+
+def _split_filename(filename: str) -> Optional[dict]:
+    """Linear-time equivalent of the default pattern: shortest doc, then shortest client."""
+    # '$' also matches before a trailing newline, and '.' never matches one
+    if filename.endswith('\n'):
+        filename = filename[:-1]
+    if '\n' in filename or filename[-4:].lower() != '.pdf':
+        return None
+    stem = filename[:-4]
+    doc_end = stem.find('_', 1)
+    if doc_end < 0:
+        return None
+    client_end = stem.find('_', doc_end + 2)
+    while client_end >= 0:
+        date_end = _date_end(stem, client_end + 1)
+        if date_end >= 0 and stem.startswith('_', date_end) and date_end + 1 < len(stem):
+            return {
+                'doc': stem[:doc_end],
+                'client': stem[doc_end + 1:client_end],
+                'date': stem[client_end + 1:date_end],
+                'status': stem[date_end + 1:],
+            }
+        client_end = stem.find('_', client_end + 1)
+    return None
+
+@functools.lru_cache(maxsize=1024)
+def _parse_cached(filename: str) -> Optional[tuple]:
+    if USE_SPLIT_PARSER:
+        parsed = _split_filename(filename)
+        return tuple(parsed.items()) if parsed is not None else None
+    match = _COMPILED_PATTERN.match(filename)
+    if not match:
+        return None
+    return tuple(match.groupdict().items())
+
+def parse_filename(filename: str) -> Optional[dict]:
+    # Repeated events for one name hit the cache; each caller still gets its own dict
+    items = _parse_cached(filename)
+    return dict(items) if items is not None else None
+
+def is_signed_status(status: str) -> bool:
+    status_lower = status.lower()
+    if '_signed' in status_lower:
+        return True
+    if 'unsigned' in status_lower:
+        return False
+    return _KEYWORD_RE.search(status_lower) is not None
+
+def normalize_path_segment(segment: str) -> str:
+    # split() already collapses whitespace runs, so no regex is needed
+    return '_'.join(segment.translate(_INVALID_CHARS).split()).strip('_.')
+
 class FilenameParser:
-    """Parses PDF filenames according to the specified pattern."""
+    """Parses PDF filenames according to the specified pattern.
 
-    @staticmethod
-    def parse_filename(filename: str) -> Optional[dict]:
-        pattern = re.compile(STATE["config"]["filename_pattern"], re.IGNORECASE)
-        match = pattern.match(filename)
-        if not match:
-            return None
-        return match.groupdict()
+    Kept for compatibility; the hot paths call the module-level functions directly.
+    """
 
-    @staticmethod
-    def is_signed_status(status: str) -> bool:
-        status_lower = status.lower()
-        if '_signed' in status_lower:
-            return True
-        if 'unsigned' in status_lower:
-            return False
-        return any(indicator in status_lower for indicator in STATE["config"]["status_keywords"])
+    parse_filename = staticmethod(parse_filename)
+    is_signed_status = staticmethod(is_signed_status)
+    normalize_path_segment = staticmethod(normalize_path_segment)
 
-    @staticmethod
-    def normalize_path_segment(segment: str) -> str:
-        normalized = re.sub(r'[<>:"/\\|?*]', '', segment)
-        normalized = re.sub(r'\s+', '_', normalized)
-        return normalized.strip('_.')
+# First stability poll delay; doubled up to the checker's interval while the size holds
+INITIAL_POLL_INTERVAL = 0.05
 
 class FileStabilityChecker:
     """Checks if a file has finished copying by monitoring size stability."""
@@ -55,72 +126,182 @@ class FileStabilityChecker:
         self.timeout = timeout
         self.check_interval = check_interval
 
-    def wait_for_stability(self, filepath: Path) -> bool:
-        if not filepath.exists():
-            return False
-        
-        start_time = time.time()
+    def wait_for_stability(self, filepath: Union[str, Path]) -> bool:
+        # One stat per poll; a missing file on the first poll means there is nothing to wait for
+        path = os.fspath(filepath)
+        first_poll = True
+
+        deadline = time.monotonic() + self.timeout
+        stat = os.stat
         last_size = -1
+        changed_at = time.monotonic()
         stable_count = 0
         effective_interval = min(self.check_interval, 0.5)
         required_stable = 1 if self.timeout >= 5.0 else 2
+        # The size must hold for as long as required_stable fixed-rate polls
+        # would take; backing off only changes how often it is sampled
+        quiet_window = required_stable * effective_interval
+        # Poll quickly at first and back off to effective_interval while the size holds
+        initial_interval = min(INITIAL_POLL_INTERVAL, effective_interval)
+        interval = initial_interval
         mtime_grace = max(1.0, effective_interval * 2)
 
-        while time.time() - start_time < self.timeout:
+        while time.monotonic() < deadline:
             try:
-                stat = filepath.stat()
-                current_size = stat.st_size
-                mtime = stat.st_mtime
-                size_stable = current_size == last_size and current_size > 0
-                mtime_stable = current_size > 0 and (time.time() - mtime) >= mtime_grace
-
-                if size_stable or mtime_stable:
-                    stable_count += 1
-                else:
-                    stable_count = 0
-
-                if stable_count >= required_stable:
+                st = stat(path)
+                first_poll = False
+                now = time.monotonic()
+                current_size = st.st_size
+                if current_size != last_size:
+                    last_size = current_size
+                    changed_at = now
+                    interval = initial_interval
+                    # st_mtime is wall-clock, so only this comparison needs time.time()
+                    if current_size > 0 and (time.time() - st.st_mtime) >= mtime_grace:
+                        stable_count += 1
+                    else:
+                        stable_count = 0
+                    if stable_count >= required_stable:
+                        return True
+                elif current_size > 0 and (stable_count or now - changed_at >= quiet_window):
+                    # An already-old file only needs its size confirmed once
                     return True
-
-                last_size = current_size
+                else:
+                    interval = min(interval * 2, effective_interval)
+                time.sleep(interval)
+            except FileNotFoundError:
+                if first_poll:
+                    return False
+                # Start the quiet window over once the file is back
+                last_size = -1
+                stable_count = 0
                 time.sleep(effective_interval)
+                continue
             except (OSError, IOError):
+                last_size = -1
                 stable_count = 0
                 time.sleep(effective_interval)
                 continue
 
         return False
 
+# link() errors meaning "no hard link possible here", not a missing or taken path
+_NO_LINK_ERRNOS = frozenset({errno.EXDEV, errno.EPERM, errno.EMLINK, errno.ENOTSUP, errno.EOPNOTSUPP})
+
+# Upper bound on destination directories PDFMover remembers as already created
+ENSURED_DIRS_MAX = 1024
+
 class PDFMover:
     """Handles moving PDFs to destination folders with duplicate handling."""
 
-    def __init__(self, dest_root: Path, dry_run: bool = False):
-        self.dest_root = Path(dest_root)
+    def __init__(self, dest_root: Union[str, Path], dry_run: bool = False,
+                 workplace_path: Optional[Union[str, Path]] = None):
+        # Kept as a plain string; destinations are built with os.path.join
+        self.dest_root = os.fspath(dest_root)
         self.dry_run = dry_run
         self.logger = logging.getLogger(__name__)
+        # Unknown workplace: assume same device and let link() report EXDEV
+        self._same_fs = workplace_path is None or self._same_device(workplace_path, self.dest_root)
+        # Bounded LRU of created directories; moves run on several handler threads
+        self._ensured_dirs = OrderedDict()
+        self._ensured_lock = threading.Lock()
+
+    def _ensure_dir(self, dest_dir: str):
+        with self._ensured_lock:
+            if dest_dir in self._ensured_dirs:
+                self._ensured_dirs.move_to_end(dest_dir)
+                return
+        os.makedirs(dest_dir, exist_ok=True)
+        with self._ensured_lock:
+            self._ensured_dirs[dest_dir] = None
+            if len(self._ensured_dirs) > ENSURED_DIRS_MAX:
+                self._ensured_dirs.popitem(last=False)
 
-    def move_signed_pdf(self, source_path: Path, parsed_info: dict) -> Optional[Path]:
+    def _forget_dir(self, dest_dir: str):
+        with self._ensured_lock:
+            self._ensured_dirs.pop(dest_dir, None)
+
+    @staticmethod
+    def _same_device(a: Union[str, Path], b: Union[str, Path]) -> bool:
+        # The destination root may not exist yet; compare its nearest existing ancestor
+        b = os.path.abspath(b)
+        while not os.path.exists(b) and os.path.dirname(b) != b:
+            b = os.path.dirname(b)
         try:
-            form_dir = FilenameParser.normalize_path_segment(parsed_info['doc'])
-            client_dir = FilenameParser.normalize_path_segment(parsed_info['client'])
-            date_dir = FilenameParser.normalize_path_segment(parsed_info['date'])
-            status_dir = FilenameParser.normalize_path_segment(parsed_info['status'])
-            
-            dest_dir = self.dest_root / form_dir / client_dir / date_dir / status_dir
-            dest_file = dest_dir / source_path.name
+            return os.stat(a).st_dev == os.stat(b).st_dev
+        except OSError:
+            return True
+
+    @staticmethod
+    def _with_timestamp(dest_file: str) -> str:
+        stem, suffix = os.path.splitext(dest_file)
+        return f"{stem}_{int(time.time())}{suffix}"
+
+    def _move_exclusive(self, source_path: str, dest_file: str) -> bool:
+        """Moves source_path to dest_file unless it exists; never overwrites."""
+        if self._same_fs:
+            try:
+                # link() fails atomically if the name is taken
+                os.link(source_path, dest_file)
+            except FileExistsError:
+                return False
+            except OSError as e:
+                if e.errno not in _NO_LINK_ERRNOS:
+                    raise
+                if e.errno == errno.EXDEV:
+                    self._same_fs = False
+            else:
+                os.unlink(source_path)
+                return True
+        # No usable hard link: reserve the name, then move over the reservation
+        try:
+            fd = os.open(dest_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+        except FileExistsError:
+            return False
+        os.close(fd)
+        try:
+            if self._same_fs:
+                # Same device: a single atomic rename over our own placeholder
+                os.replace(source_path, dest_file)
+            else:
+                shutil.move(source_path, dest_file)
+        except BaseException:
+            os.unlink(dest_file)
+            raise
+        return True
+
+    def move_signed_pdf(self, source_path: Union[str, Path], parsed_info: dict) -> Optional[str]:
+        source_path = os.fspath(source_path)
+        try:
+            normalize = normalize_path_segment
+            form_dir = normalize(parsed_info['doc'])
+            client_dir = normalize(parsed_info['client'])
+            date_dir = normalize(parsed_info['date'])
+            status_dir = normalize(parsed_info['status'])
             
-            if dest_file.exists():
-                timestamp = int(time.time())
-                stem = dest_file.stem
-                suffix = dest_file.suffix
-                dest_file = dest_dir / f"{stem}_{timestamp}{suffix}"
+            dest_dir = os.path.join(self.dest_root, form_dir, client_dir, date_dir, status_dir)
+            dest_file = os.path.join(dest_dir, os.path.basename(source_path))
             
             if self.dry_run:
+                if os.path.exists(dest_file):
+                    dest_file = self._with_timestamp(dest_file)
                 self.logger.info(f"[DRY RUN] Would move: {source_path} -> {dest_file}")
                 return dest_file
             
-            dest_dir.mkdir(parents=True, exist_ok=True)
-            shutil.move(str(source_path), str(dest_file))
+            self._ensure_dir(dest_dir)
+            try:
+                moved = self._move_exclusive(source_path, dest_file)
+            except FileNotFoundError:
+                # The cached directory may have been removed behind our back
+                if not os.path.exists(source_path):
+                    raise
+                self._forget_dir(dest_dir)
+                self._ensure_dir(dest_dir)
+                moved = self._move_exclusive(source_path, dest_file)
+            if not moved:
+                dest_file = self._with_timestamp(dest_file)
+                if not self._move_exclusive(source_path, dest_file):
+                    raise FileExistsError(f"Destination already exists: {dest_file}")
             self.logger.info(f"Moved: {source_path} -> {dest_file}")
             return dest_file
             
@@ -128,52 +309,97 @@ class PDFMover:
             self.logger.error(f"Failed to move {source_path}: {e}")
             return None
 
+# inotify reports close-after-write; other backends fall back to stat polling
+CLOSE_EVENTS_SUPPORTED = Observer.__name__ == 'InotifyObserver'
+# How long a worker waits for the first close-after-write event before falling
+# back to FileStabilityChecker polling; a writer may hold the file open longer,
+# it then just pays for the poll
+CLOSE_WAIT_SECONDS = 1.0
+
 class MyHandler(FileSystemEventHandler):
-    def __init__(self, mover: PDFMover, stability_checker: FileStabilityChecker):
+    def __init__(self, mover: PDFMover, stability_checker: FileStabilityChecker, max_workers: int = 4):
         self.mover = mover
         self.stability_checker = stability_checker
         self.logger = logging.getLogger(__name__)
+        # path -> Event set once the writer closes the file
+        self.closed = {}
+        self.closed_lock = threading.Lock()
+        # Stability waits and moves run here so the observer thread only dispatches
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="pdf-worker")
 
     def on_created(self, event):
-        if not event.is_directory:
-            self._process_file(Path(event.src_path))
+        # Plain string checks; no Path is built for directories or non-PDF sidecars
+        path = event.src_path
+        if event.is_directory or not path.lower().endswith('.pdf'):
+            return
+        if CLOSE_EVENTS_SUPPORTED:
+            with self.closed_lock:
+                self.closed[path] = threading.Event()
+        # Waiting happens off the observer thread so it can keep dispatching close events
+        self._pool.submit(self._process_file, path, os.path.basename(path))
+
+    def shutdown(self, wait: bool = True):
+        """Stops accepting files and optionally waits for in-flight ones."""
+        self._pool.shutdown(wait=wait)
 
-    def _process_file(self, filepath: Path):
-        if filepath.suffix.lower() != '.pdf':
+    def on_closed(self, event):
+        if event.is_directory:
             return
+        with self.closed_lock:
+            closed = self.closed.get(event.src_path)
+        if closed:
+            closed.set()
+
+    def _wait_until_written(self, path: str) -> bool:
+        with self.closed_lock:
+            closed = self.closed.get(path)
+        if closed and closed.wait(CLOSE_WAIT_SECONDS):
+            return True
+        return self.stability_checker.wait_for_stability(path)
+
+    def _process_file(self, path: str, name: str):
+        try:
+            self._handle_pdf(path, name)
+        finally:
+            with self.closed_lock:
+                self.closed.pop(path, None)
+
+    def _handle_pdf(self, path: str, name: str):
+        logging.info(f"Processing file: {path}")
         
-        logging.info(f"Processing file: {filepath}")
-        
-        parsed_info = FilenameParser.parse_filename(filepath.name)
+        parsed_info = parse_filename(name)
         if not parsed_info:
-            logging.info(f"Filename doesn't match pattern: {filepath.name}")
+            logging.info(f"Filename doesn't match pattern: {name}")
             return
         
-        if not FilenameParser.is_signed_status(parsed_info['status']):
-            logging.info(f"Document not signed, ignoring: {filepath.name}")
+        if not is_signed_status(parsed_info['status']):
+            logging.info(f"Document not signed, ignoring: {name}")
             return
         
-        logging.info(f"Found signed document: {filepath.name}")
+        logging.info(f"Found signed document: {name}")
         
-        if not self.stability_checker.wait_for_stability(filepath):
-            logging.warning(f"File did not stabilize within timeout: {filepath}")
+        if not self._wait_until_written(path):
+            logging.warning(f"File did not stabilize within timeout: {path}")
             return
         
-        self.mover.move_signed_pdf(filepath, parsed_info)
+        self.mover.move_signed_pdf(path, parsed_info)
 
 if __name__ == "__main__":
     config = STATE['config']
     stability_checker = FileStabilityChecker(timeout=config['stability_wait_seconds'])
-    mover = PDFMover(Path(config['destination_root']), dry_run=config['dry_run_mode'])
+    mover = PDFMover(Path(config['destination_root']), dry_run=config['dry_run_mode'],
+                     workplace_path=config['workplace_path'])
     event_handler = MyHandler(mover, stability_checker)
     
     observer = Observer()
     observer.schedule(event_handler, config['workplace_path'], recursive=False)
     observer.start()
     print(f'Watching directory: {config["workplace_path"]}')
-    try:
-        while True:
-            time.sleep(1)
-    except KeyboardInterrupt:
-        observer.stop()
-    observer.join()
\ No newline at end of file
+    # Block without polling until Ctrl+C or SIGTERM
+    stop_event = threading.Event()
+    signal.signal(signal.SIGINT, lambda *_: stop_event.set())
+    signal.signal(signal.SIGTERM, lambda *_: stop_event.set())
+    stop_event.wait()
+    observer.stop()
+    observer.join()
+    event_handler.shutdown(wait=True)
\ No newline at end of file
@@ -13,14 +13,15 @@ fi
 echo "Installing test dependencies..."
 pip install -r requirements-dev.txt
 
-# Run tests with different options
+# Run tests with different options; every test works in its own temp
+# directory, so they are spread over all cores with pytest-xdist
 echo ""
 echo "=== Running Unit Tests ==="
-python -m pytest tests/ -v
+python -m pytest tests/ -v -n auto
 
 echo ""
 echo "=== Running Tests with Coverage ==="
-python -m pytest tests/ --cov=src --cov-report=term-missing
+python -m pytest tests/ -n auto --cov=src --cov-report=term-missing
 
 echo ""
 echo "=== Running specific test file ==="
@@ -4,18 +4,25 @@ Provides REST API endpoints and WebSocket for real-time updates.
 """
 
 import asyncio
+import functools
 import json
 import logging
+import os
 import time
+from collections import deque
 from datetime import datetime
+import itertools
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, NamedTuple, Optional, Set, Any
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect, BackgroundTasks, Request
+from fastapi import FastAPI, HTTPException, Query, WebSocket, WebSocketDisconnect, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel, field_validator
+from pydantic import BaseModel, ValidationInfo, field_validator
 import uvicorn
 
 from signed_watcher import (
@@ -23,8 +30,10 @@ from signed_watcher import (
     PDFMover, 
     FileStabilityChecker,
     PDFWatchHandler,
+    DEBOUNCE_SECONDS,
     setup_logging
 )
+from watchdog.events import FileClosedEvent, FileCreatedEvent, FileDeletedEvent, FileMovedEvent
 from watchdog.observers import Observer
 
 
@@ -45,14 +54,23 @@ class Configuration(BaseModel):
     status_keywords: List[str] = ["signed", "executed", "final"]
     filename_pattern: str = r'^(?P<doc>.+?)_(?P<client>.+?)_(?P<date>\d{4}-?\d{2}-?\d{2})_(?P<status>.+?)\.pdf$'
     log_level: str = "INFO"
+
+    @functools.cached_property
+    def status_keywords_lc(self) -> tuple:
+        """Lowercased status_keywords, computed once per configuration."""
+        return tuple(keyword.lower() for keyword in self.status_keywords)
     
     @field_validator('workplace_path', 'destination_root')
     @classmethod
-    def validate_paths(cls, v):
+    def validate_paths(cls, v, info: ValidationInfo):
         path = Path(v)
-        if not path.exists():
-            raise ValueError(f"Path does not exist: {v}")
+        # Configs we saved ourselves were checked when they were submitted
+        if info.context and info.context.get("trusted"):
+            return str(path.absolute())
+        # One stat in the common case; exists() only runs to word the error
         if not path.is_dir():
+            if not path.exists():
+                raise ValueError(f"Path does not exist: {v}")
             raise ValueError(f"Path is not a directory: {v}")
         return str(path.absolute())
 
@@ -78,14 +96,97 @@ class LogEntry(BaseModel):
     extra_data: Optional[Dict[str, Any]] = None
 
 
+class LogRecordLite(NamedTuple):
+    """Log record kept in the ring; turned into a LogEntry on read."""
+    created: float
+    level: str
+    message: str
+    module: str
+    file_path: Optional[str] = None
+    extra_data: Optional[Dict[str, Any]] = None
+
+    def to_entry(self) -> LogEntry:
+        return LogEntry(
+            timestamp=datetime.fromtimestamp(self.created),
+            level=self.level,
+            message=self.message,
+            module=self.module,
+            file_path=self.file_path,
+            extra_data=self.extra_data
+        )
+
+
 class ProcessFileRequest(BaseModel):
     file_path: str
     force: bool = False
 
 
+class LogRing:
+    """Fixed-size multi-producer log buffer that never blocks writers.
+
+    Each writer claims a sequence number from an itertools.count (atomic under
+    the GIL) and stores ``(seq, entry)`` in slot ``seq & mask``. Readers copy the
+    slot list in one step and order it by sequence, so a snapshot taken while
+    writers are active may miss the entries still being stored.
+    """
+
+    def __init__(self, capacity: int = 1024):
+        if capacity & (capacity - 1):
+            raise ValueError("capacity must be a power of two")
+        self._slots: List[Optional[tuple]] = [None] * capacity
+        self._mask = capacity - 1
+        self._seq = itertools.count()
+        self._written = 0
+
+    def append(self, entry) -> int:
+        """Stores entry and returns its sequence number."""
+        seq = next(self._seq)
+        self._slots[seq & self._mask] = (seq, entry)
+        self._written = seq + 1
+        return seq
+
+    def snapshot(self) -> list:
+        """Returns the buffered entries, oldest first."""
+        slots = [slot for slot in self._slots[:] if slot is not None]
+        slots.sort(key=itemgetter(0))
+        return [entry for _, entry in slots]
+
+    @property
+    def oldest_seq(self) -> int:
+        """Sequence number of the oldest entry still buffered."""
+        return max(self._written - (self._mask + 1), 0)
+
+    def __len__(self) -> int:
+        return min(self._written, self._mask + 1)
+
+
+# The only events PDFWatchHandler acts on (closes end the stability wait on
+# inotify, deletes drop its bookkeeping); with watchdog >= 4 the rest are
+# dropped by the emitter (and left out of the inotify mask) instead of being
+# dispatched to Python
+WATCH_EVENT_TYPES = [FileCreatedEvent, FileMovedEvent, FileClosedEvent, FileDeletedEvent]
+
+# Quiet period that batches bursts of state changes into one status broadcast
+STATUS_BROADCAST_DELAY = 0.02
+
+def _shutdown_watcher(observer, event_handler) -> None:
+    """Stop the observer, then the handler's debounce worker (blocking)."""
+    if observer:
+        observer.stop()
+        observer.join()
+    if event_handler:
+        event_handler.stop()
+
+
 # Global state management
 class ServiceManager:
     def __init__(self):
+        # JSON around the uptime value: (head, tail), dropped by mark_status_dirty()
+        self._status_json_parts: Optional[tuple] = None
+        # Serialized configuration and shared mover, dropped whenever
+        # configuration is reassigned
+        self._config_json: Optional[str] = None
+        self._mover: Optional["LoggedPDFMover"] = None
         self.status = "stopped"
         self.start_time: Optional[float] = None
         self.observer: Optional[Observer] = None
@@ -93,10 +194,26 @@ class ServiceManager:
         self.files_processed_today = 0
         self.queue_size = 0
         self.last_error: Optional[str] = None
-        self.configuration: Optional[Configuration] = None
-        self.recent_files: List[FileInfo] = []
-        self.log_entries: List[LogEntry] = []
-        self.websocket_connections: List[WebSocket] = []
+        self._configuration: Optional[Configuration] = None
+        # Bounded ring buffers: appends evict the oldest entry in O(1)
+        self.recent_files: deque = deque(maxlen=200)  # newest first
+        self.log_entries = LogRing(1024)  # written from any thread, oldest first
+        # Per-level index into log_entries: level -> LogRing of (seq, entry)
+        self.log_levels: Dict[str, LogRing] = {}
+        self.websocket_connections: Set[WebSocket] = set()
+        # Coalesced status broadcasts; created on the running event loop
+        self._status_dirty: Optional[asyncio.Event] = None
+        self._broadcast_task: Optional[asyncio.Task] = None
+
+    @property
+    def configuration(self) -> Optional[Configuration]:
+        return self._configuration
+
+    @configuration.setter
+    def configuration(self, config: Optional[Configuration]) -> None:
+        self._configuration = config
+        self._config_json = None
+        self._mover = None
         
     async def start_service(self, config: Configuration):
         """Start the file watching service."""
@@ -129,28 +246,39 @@ class ServiceManager:
 
             # Initialize components
             stability_checker = FileStabilityChecker(timeout=config.stable_wait_seconds)
-            mover = LoggedPDFMover(Path(config.destination_root), dry_run=config.dry_run_mode)
-            self.event_handler = PDFWatchHandler(mover, stability_checker)
+            mover = self.get_mover()
+            self.event_handler = PDFWatchHandler(
+                mover, stability_checker, debounce_seconds=DEBOUNCE_SECONDS
+            )
             
-            # Setup file watcher
+            # Setup file watcher (the platform default: inotify on Linux)
             self.observer = Observer()
-            self.observer.schedule(
-                self.event_handler, 
-                config.workplace_path, 
-                recursive=False
-            )
+            try:
+                self.observer.schedule(
+                    self.event_handler,
+                    config.workplace_path,
+                    recursive=False,
+                    event_filter=WATCH_EVENT_TYPES
+                )
+            except TypeError:
+                # watchdog < 4 has no event_filter; the handler ignores the extra events
+                self.observer.schedule(
+                    self.event_handler, 
+                    config.workplace_path, 
+                    recursive=False
+                )
             self.observer.start()
             
             self.status = "running"
             self.start_time = time.time()
             self.last_error = None
             
-            await self.broadcast_status_update()
+            self.mark_status_dirty()
             
         except Exception as e:
             self.status = "error"
             self.last_error = str(e)
-            await self.broadcast_status_update()
+            self.mark_status_dirty()
             raise HTTPException(status_code=500, detail=str(e))
     
     async def stop_service(self):
@@ -159,22 +287,30 @@ class ServiceManager:
             return
             
         try:
-            if self.observer:
-                self.observer.stop()
-                self.observer.join()
-                self.observer = None
+            # Joining the observer and the debounce worker blocks; keep it off
+            # the event loop so websockets and broadcasts keep running
+            observer, self.observer = self.observer, None
+            await asyncio.to_thread(_shutdown_watcher, observer, self.event_handler)
                 
             self.status = "stopped"
             self.start_time = None
             
-            await self.broadcast_status_update()
+            self.mark_status_dirty()
             
         except Exception as e:
             self.status = "error"
             self.last_error = str(e)
-            await self.broadcast_status_update()
+            self.mark_status_dirty()
             raise HTTPException(status_code=500, detail=str(e))
     
+    def add_log_entry(self, entry: LogRecordLite) -> None:
+        """Append to log_entries and to the ring for the entry's level."""
+        seq = self.log_entries.append(entry)
+        ring = self.log_levels.get(entry.level)
+        if ring is None:
+            ring = self.log_levels.setdefault(entry.level, LogRing(1024))
+        ring.append((seq, entry))
+
     def get_status(self) -> ServiceStatus:
         """Get current service status."""
         uptime = None
@@ -188,28 +324,96 @@ class ServiceManager:
             queue_size=self.queue_size,
             last_error=self.last_error
         )
+
+    def get_status_json(self) -> str:
+        """Serialized ServiceStatus; only uptime_seconds is recomputed per call."""
+        parts = self._status_json_parts
+        if parts is None:
+            parts = self._status_json_parts = (
+                '{"status":%s,"uptime_seconds":' % json.dumps(self.status),
+                ',"files_processed_today":%d,"queue_size":%d,"last_error":%s}' % (
+                    self.files_processed_today, self.queue_size, json.dumps(self.last_error)
+                ),
+            )
+        uptime = "null"
+        if self.start_time and self.status == "running":
+            uptime = str(int(time.time() - self.start_time))
+        return parts[0] + uptime + parts[1]
+
+    def get_mover(self) -> "LoggedPDFMover":
+        """Mover for the current configuration, shared by the watcher and reprocess requests."""
+        mover = self._mover
+        if mover is None:
+            config = self.configuration
+            mover = self._mover = LoggedPDFMover(Path(config.destination_root), dry_run=config.dry_run_mode)
+        return mover
+
+    def get_config_json(self) -> str:
+        """Serialized configuration, built once per assignment."""
+        if self._config_json is None:
+            self._config_json = self.configuration.model_dump_json()
+        return self._config_json
+
+    def get_status_message(self) -> str:
+        """WebSocket status_update message built around get_status_json()."""
+        return '{"type":"status_update","data":' + self.get_status_json() + '}'
     
+    def start_broadcaster(self):
+        """Start the status broadcaster on the running loop if it is not already there."""
+        loop = asyncio.get_running_loop()
+        task = self._broadcast_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._status_dirty = asyncio.Event()
+            self._broadcast_task = loop.create_task(self._broadcaster())
+
+    async def stop_broadcaster(self):
+        task, self._broadcast_task = self._broadcast_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    def mark_status_dirty(self):
+        """Drop the cached status JSON and schedule a status broadcast.
+
+        Must follow every change to a ServiceStatus field; changes within
+        STATUS_BROADCAST_DELAY share one broadcast.
+        """
+        self._status_json_parts = None
+        self.start_broadcaster()
+        self._status_dirty.set()
+
+    async def _broadcaster(self):
+        while True:
+            await self._status_dirty.wait()
+            await asyncio.sleep(STATUS_BROADCAST_DELAY)
+            # Clear after the quiet period so changes made during it are included
+            self._status_dirty.clear()
+            try:
+                await self.broadcast_status_update()
+            except Exception as e:
+                logging.warning(f"Status broadcast failed: {e}")
+
     async def broadcast_status_update(self):
         """Broadcast status update to all connected WebSocket clients."""
         if not self.websocket_connections:
             return
             
-        status = self.get_status()
-        message = {
-            "type": "status_update",
-            "data": status.dict()
-        }
+        payload = self.get_status_message()
+        
+        # Send to every client concurrently; one slow socket no longer delays the rest
+        connections = list(self.websocket_connections)
+        results = await asyncio.gather(
+            *(websocket.send_text(payload) for websocket in connections),
+            return_exceptions=True
+        )
         
         # Remove disconnected websockets
-        active_connections = []
-        for websocket in self.websocket_connections:
-            try:
-                await websocket.send_text(json.dumps(message, default=str))
-                active_connections.append(websocket)
-            except:
-                pass  # Connection closed
-                
-        self.websocket_connections = active_connections
+        for websocket, result in zip(connections, results):
+            if isinstance(result, Exception):
+                self.websocket_connections.discard(websocket)
 
 
 # Global service manager instance
@@ -218,25 +422,22 @@ service_manager = ServiceManager()
 
 # Logging handler that forwards Python logging records into the service manager
 class ServiceLogHandler(logging.Handler):
-    def __init__(self, capacity: int = 1000):
+    def __init__(self):
         super().__init__()
-        self.capacity = capacity
 
     def emit(self, record: logging.LogRecord) -> None:
         try:
-            entry = LogEntry(
-                timestamp=datetime.fromtimestamp(record.created),
-                level=record.levelname,
-                message=record.getMessage(),
-                module=record.module if hasattr(record, 'module') else '',
-                file_path=getattr(record, 'pathname', None),
-                extra_data=None
+            # The message is rendered now, while its arguments still hold the
+            # logged values; model validation is deferred to /api/v1/logs
+            entry = LogRecordLite(
+                record.created,
+                record.levelname,
+                record.getMessage(),
+                record.module if hasattr(record, 'module') else '',
+                getattr(record, 'pathname', None),
             )
-            # Append entry (bounded capacity)
-            service_manager.log_entries.append(entry)
-            if len(service_manager.log_entries) > self.capacity:
-                # trim oldest entries
-                service_manager.log_entries.pop(0)
+            # log_entries is bounded; the oldest entry is evicted automatically
+            service_manager.add_log_entry(entry)
         except Exception:
             # Logging must not raise
             pass
@@ -248,42 +449,52 @@ if not any(isinstance(h, ServiceLogHandler) for h in _root_logger.handlers):
     _root_logger.addHandler(ServiceLogHandler())
 
 
+def _safe_size(path: Path) -> int:
+    """Size of path in bytes from a single stat, or 0 if it cannot be read."""
+    try:
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
 # Wrapper mover that records moves into service_manager for API-triggered operations
 class LoggedPDFMover:
     def __init__(self, dest_root: Path, dry_run: bool = False):
         self.mover = PDFMover(dest_root, dry_run=dry_run)
 
-    def move(self, source_path: Path, parsed_info: dict) -> bool:
+    def move(self, source_path: Path, parsed_info: dict, size: Optional[int] = None) -> bool:
+        # Size is read before the move, which takes the source away
+        if size is None:
+            size = _safe_size(source_path)
         # Perform move and log result into service manager
         result = self.mover.move_signed_pdf(source_path, parsed_info)
         try:
-            entry = LogEntry(
-                timestamp=datetime.now(),
+            # One clock read serves both the log record and the FileInfo times
+            created = time.time()
+            now = datetime.fromtimestamp(created)
+            entry = LogRecordLite(
+                created=created,
                 level="INFO" if result else "ERROR",
                 message=f"Moved {source_path} -> {parsed_info.get('client')}/{parsed_info.get('date')}/{parsed_info.get('status')}: {'OK' if result else 'FAIL'}",
                 module=__name__,
                 file_path=str(source_path),
                 extra_data={"parsed": parsed_info}
             )
-            service_manager.log_entries.append(entry)
-            if len(service_manager.log_entries) > 1000:
-                service_manager.log_entries.pop(0)
+            service_manager.add_log_entry(entry)
 
             # Update recent_files
             info = FileInfo(
-                id=f"manual_{int(time.time())}",
+                id=f"manual_{int(created)}",
                 original_path=str(source_path),
                 destination_path=None if self.mover.dry_run else None,
                 status="processed" if result else "failed",
-                detected_at=datetime.now(),
-                processed_at=datetime.now() if result else None,
-                file_size_bytes=source_path.stat().st_size if source_path.exists() else 0,
+                detected_at=now,
+                processed_at=now if result else None,
+                file_size_bytes=size,
                 error_message=None if result else "move failed",
                 parsed_metadata=parsed_info
             )
-            service_manager.recent_files.insert(0, info)
-            if len(service_manager.recent_files) > 200:
-                service_manager.recent_files.pop()
+            service_manager.recent_files.appendleft(info)
         except Exception:
             pass
         return result
@@ -297,6 +508,19 @@ class LoggedPDFMover:
 CONFIG_FILE = Path(__file__).resolve().parents[1] / "config.json"
 
 
+def _write_config_file(data: str) -> None:
+    """Replace CONFIG_FILE atomically so a crash never leaves a truncated file."""
+    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = CONFIG_FILE.with_suffix(".json.tmp")
+    tmp.write_text(data)
+    os.replace(tmp, CONFIG_FILE)
+
+
+async def save_config(config: Configuration) -> None:
+    """Persist config without blocking the event loop on disk I/O."""
+    await asyncio.to_thread(_write_config_file, config.model_dump_json(indent=2))
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup: try to load persisted config
@@ -304,23 +528,43 @@ async def lifespan(app: FastAPI):
         try:
             raw = CONFIG_FILE.read_text()
             data = json.loads(raw)
-            # Validate & set configuration (will raise on invalid paths)
-            service_manager.configuration = Configuration(**data)
+            # Our own saved file: skip the filesystem checks on the paths, which
+            # start_service surfaces anyway if a directory has since gone away
+            service_manager.configuration = Configuration.model_validate(data, context={"trusted": True})
             logging.info(f"Loaded persisted configuration from {CONFIG_FILE}")
         except Exception as e:
             logging.warning(f"Failed to load persisted configuration: {e}")
+    service_manager.start_broadcaster()
     yield
     # Shutdown
     if service_manager.status == "running":
         await service_manager.stop_service()
+    await service_manager.stop_broadcaster()
+
+
+# Render JSON responses with orjson when it is installed
+try:
+    import orjson
 
+    class DefaultResponse(JSONResponse):
+        """JSONResponse rendered by orjson."""
+
+        def render(self, content: Any) -> bytes:
+            return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+    def json_dumps(obj: Any) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    DefaultResponse = JSONResponse
+    json_dumps = json.dumps
 
 # FastAPI app setup
 app = FastAPI(
     title="File Organizer API",
     description="REST API for the Signed PDF File Organizer",
     version="1.0.0",
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=DefaultResponse
 )
 
 # CORS middleware
@@ -338,26 +582,25 @@ app.add_middleware(
 @app.get("/api/v1/status", response_model=ServiceStatus)
 async def get_service_status():
     """Get current service status."""
-    return service_manager.get_status()
+    return Response(content=service_manager.get_status_json(), media_type="application/json")
 
 
-@app.api_route("/api/v1/start", methods=["GET", "POST"])
-async def start_service_endpoint(
-    request: Request,
-    background_tasks: BackgroundTasks,
-    config: Optional[Configuration] = None
-):
-    """Start service on POST. Informational response on GET.
-    If POST includes a Configuration JSON body, save and use it before starting.
+@app.get("/api/v1/start")
+async def start_service_info():
+    """Informational response; starting the service requires POST."""
+    status = service_manager.get_status()
+    return {
+        "detail": "This endpoint requires POST to start the service. Use POST /api/v1/start.",
+        "current_status": status.dict()
+    }
+
+
+@app.post("/api/v1/start")
+async def start_service_endpoint(config: Optional[Configuration] = None):
+    """Start service.
+    If the request includes a Configuration JSON body, save and use it before starting.
     """
-    if request.method == "GET":
-        status = service_manager.get_status()
-        return {
-            "detail": "This endpoint requires POST to start the service. Use POST /api/v1/start.",
-            "current_status": status.dict()
-        }
-
-    # POST: if config provided in body, persist and set it
+    # If config provided in body, persist and set it
     if config is not None:
         try:
             # Stop running service to apply new config safely
@@ -367,8 +610,7 @@ async def start_service_endpoint(
             # Assign and persist config as in /config endpoint
             service_manager.configuration = config
             try:
-                CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-                CONFIG_FILE.write_text(json.dumps(config.dict(), indent=2))
+                await save_config(config)
                 logging.info(f"Saved configuration to {CONFIG_FILE} via /start")
             except Exception as e:
                 logging.error(f"Failed to persist configuration via /start: {e}")
@@ -386,17 +628,19 @@ async def start_service_endpoint(
     return {"message": "Service started successfully"}
 
 
-@app.api_route("/api/v1/stop", methods=["GET", "POST"])
-async def stop_service_endpoint(request: Request):
-    """Stop service on POST. Informational response on GET."""
-    if request.method == "GET":
-        status = service_manager.get_status()
-        return {
-            "detail": "This endpoint requires POST to stop the service. Use POST /api/v1/stop.",
-            "current_status": status.dict()
-        }
+@app.get("/api/v1/stop")
+async def stop_service_info():
+    """Informational response; stopping the service requires POST."""
+    status = service_manager.get_status()
+    return {
+        "detail": "This endpoint requires POST to stop the service. Use POST /api/v1/stop.",
+        "current_status": status.dict()
+    }
 
-    # POST: perform stop
+
+@app.post("/api/v1/stop")
+async def stop_service_endpoint():
+    """Stop service."""
     await service_manager.stop_service()
     return {"message": "Service stopped successfully"}
 
@@ -406,7 +650,7 @@ async def get_configuration():
     """Get current configuration."""
     if not service_manager.configuration:
         raise HTTPException(status_code=404, detail="No configuration found")
-    return service_manager.configuration
+    return Response(content=service_manager.get_config_json(), media_type="application/json")
 
 
 @app.post("/api/v1/config")
@@ -420,8 +664,7 @@ async def update_configuration(config: Configuration):
 
     # Persist configuration to disk
     try:
-        CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-        CONFIG_FILE.write_text(json.dumps(config.dict(), indent=2))
+        await save_config(config)
         logging.info(f"Saved configuration to {CONFIG_FILE}")
     except Exception as e:
         logging.error(f"Failed to persist configuration: {e}")
@@ -442,7 +685,8 @@ async def get_recent_files(
     client: Optional[str] = None
 ):
     """Get recently processed files."""
-    files = service_manager.recent_files
+    # Snapshot first; the watcher thread may append while we filter
+    files = list(service_manager.recent_files)
     
     # Apply filters
     if status:
@@ -452,7 +696,7 @@ async def get_recent_files(
                 f.parsed_metadata.get('client', '').lower() == client.lower()]
     
     # Apply limit
-    files = files[:limit]
+    files = list(islice(files, limit))
     
     return {
         "files": files,
@@ -462,54 +706,104 @@ async def get_recent_files(
 
 
 @app.get("/api/v1/files/preview")
-async def preview_files():
-    """Preview files that would be processed."""
+async def preview_files(
+    limit: int = Query(500, ge=1, le=10000),
+    offset: int = Query(0, ge=0),
+):
+    """Preview files that would be processed.
+
+    Returns at most ``limit`` PDFs after skipping ``offset``. Every PDF is
+    still classified so the summary covers the whole workplace; only the
+    returned page is serialized.
+    """
     if not service_manager.configuration:
         raise HTTPException(status_code=400, detail="Configuration required")
     
     config = service_manager.configuration
     workplace_path = Path(config.workplace_path)
+    keywords = config.status_keywords_lc
     
-    preview_results = []
-    total_files = 0
-    would_process = 0
-    would_skip = 0
-    
-    # Scan workplace directory
-    for file_path in workplace_path.glob("*.pdf"):
-        total_files += 1
-        parsed = FilenameParser.parse_filename(file_path.name)
-        
-        # Check if parsed data contains a status that matches configured keywords
-        if parsed and parsed.get('status') and any(
-            keyword.lower() in parsed['status'].lower() 
-            for keyword in config.status_keywords
-        ):
-            would_process += 1
-            preview_results.append({
-                "file_path": str(file_path),
-                "would_process": True,
-                "reason": "Matches pattern and contains signed status",
-                "parsed_metadata": parsed
-            })
-        else:
-            would_skip += 1
-            preview_results.append({
-                "file_path": str(file_path),
-                "would_process": False,
-                "reason": "No signed status keyword found" if parsed else "Filename doesn't match pattern",
-                "parsed_metadata": parsed
-            })
-    
-    return {
-        "files": preview_results,
-        "summary": {
+    # Scan workplace directory; scandir already knows each entry's type for
+    # regular files, so no per-file Path is needed. Opened before streaming
+    # starts so a missing directory previews as empty (as glob() did) and any
+    # other failure is still a clean error; an unconsumed iterator is closed
+    # when collected.
+    try:
+        entries = await asyncio.to_thread(os.scandir, workplace_path)
+    except (FileNotFoundError, NotADirectoryError):
+        entries = None
+    except OSError as e:
+        raise HTTPException(status_code=500, detail=f"Cannot scan workplace: {e}")
+
+    def generate():
+        # Entries are serialized as they are scanned; the summary closes the document
+        seen = 0
+        emitted = 0
+        has_more = False
+        total_files = 0
+        would_process = 0
+        would_skip = 0
+        scan_error = None
+        yield '{"files":['
+        if entries is not None:
+            try:
+                with entries:
+                    for entry in entries:
+                        # Case-insensitive like the watcher; only the suffix is lowercased
+                        if entry.name[-4:].lower() != ".pdf" or not entry.is_file():
+                            continue
+
+                        index = seen
+                        seen += 1
+                        in_page = index >= offset and emitted < limit
+                        if index >= offset and not in_page:
+                            has_more = True
+
+                        total_files += 1
+                        parsed = FilenameParser.parse_filename(entry.name)
+
+                        # Check if parsed data contains a status that matches configured keywords
+                        status_lower = parsed['status'].lower() if parsed and parsed.get('status') else None
+                        if status_lower and any(keyword in status_lower for keyword in keywords):
+                            would_process += 1
+                            item = {
+                                "file_path": entry.path,
+                                "would_process": True,
+                                "reason": "Matches pattern and contains signed status",
+                                "parsed_metadata": parsed
+                            }
+                        else:
+                            would_skip += 1
+                            item = {
+                                "file_path": entry.path,
+                                "would_process": False,
+                                "reason": "No signed status keyword found" if parsed else "Filename doesn't match pattern",
+                                "parsed_metadata": parsed
+                            }
+
+                        if in_page:
+                            if emitted:
+                                yield ','
+                            emitted += 1
+                            yield json_dumps(item)
+            except OSError as e:
+                # Close the document cleanly; the client sees a partial, flagged result
+                logging.warning(f"Preview scan of {workplace_path} failed: {e}")
+                scan_error = str(e)
+                has_more = False
+
+        yield '],"summary":' + json_dumps({
             "total_files": total_files,
             "would_process": would_process,
             "would_skip": would_skip,
             "conflicts": 0  # TODO: Implement conflict detection
-        }
-    }
+        }) + ',"limit":%d,"offset":%d,"has_more":%s' % (limit, offset, "true" if has_more else "false")
+        if scan_error is not None:
+            yield ',"error":' + json_dumps(scan_error)
+        yield '}'
+
+    # A plain iterator is consumed in the threadpool, keeping the scan off the event loop
+    return StreamingResponse(generate(), media_type="application/json")
 
 
 @app.post("/api/v1/files/reprocess")
@@ -517,7 +811,8 @@ async def reprocess_file(request: ProcessFileRequest):
     """Manually reprocess a specific file."""
     file_path = Path(request.file_path)
     
-    if not file_path.exists():
+    # Filesystem calls run in the thread pool so a slow mount cannot stall the loop
+    if not await asyncio.to_thread(file_path.exists):
         raise HTTPException(status_code=404, detail="File not found")
     
     if not service_manager.configuration:
@@ -527,7 +822,7 @@ async def reprocess_file(request: ProcessFileRequest):
     if request.force:
         try:
             config = service_manager.configuration
-            mover = LoggedPDFMover(Path(config.destination_root), dry_run=config.dry_run_mode)
+            mover = service_manager.get_mover()
 
             parsed = FilenameParser.parse_filename(file_path.name)
             if not parsed:
@@ -536,30 +831,33 @@ async def reprocess_file(request: ProcessFileRequest):
             if not FilenameParser.is_signed_status(parsed.get('status', '')):
                 raise HTTPException(status_code=400, detail="File status not considered signed")
 
-            success = mover.move(file_path, parsed)
+            def move_now():
+                size = _safe_size(file_path)
+                return size, mover.move(file_path, parsed, size=size)
+
+            size, success = await asyncio.to_thread(move_now)
+            now = datetime.now()
+            processing_id = f"reproc_{int(now.timestamp())}"
 
             # Record recent file entry
             info = FileInfo(
-                id=f"reproc_{int(time.time())}",
+                id=processing_id,
                 original_path=str(file_path),
                 destination_path=None if config.dry_run_mode else None,
                 status="processed" if success else "failed",
-                detected_at=datetime.now(),
-                processed_at=datetime.now() if success else None,
-                file_size_bytes=file_path.stat().st_size,
+                detected_at=now,
+                processed_at=now if success else None,
+                file_size_bytes=size,
                 error_message=None if success else "move failed",
                 parsed_metadata=parsed
             )
-            service_manager.recent_files.insert(0, info)
-            # Keep recent_files bounded
-            if len(service_manager.recent_files) > 200:
-                service_manager.recent_files.pop()
+            service_manager.recent_files.appendleft(info)
 
             return {
                 "message": "File reprocessed",
                 "success": success,
-                "processing_id": f"reproc_{int(time.time())}",
-                "processed_at": datetime.now().isoformat()
+                "processing_id": processing_id,
+                "processed_at": now.isoformat()
             }
         except HTTPException:
             raise
@@ -581,16 +879,20 @@ async def get_logs(
     search: Optional[str] = None
 ):
     """Get application logs."""
-    logs = service_manager.log_entries
-    
-    # Apply filters
+    # Apply filters; a level filter reads only that level's ring, skipping
+    # entries that have already left log_entries
     if level:
-        logs = [log for log in logs if log.level == level.upper()]
+        ring = service_manager.log_levels.get(level.upper())
+        oldest = service_manager.log_entries.oldest_seq
+        logs = [log for seq, log in ring.snapshot() if seq >= oldest] if ring else []
+    else:
+        logs = service_manager.log_entries.snapshot()
     if search:
         logs = [log for log in logs if search.lower() in log.message.lower()]
     
-    # Apply limit
-    logs = logs[-limit:] if limit else logs
+    # Apply limit (newest entries are at the end); only the returned window is validated
+    skip = max(len(logs) - limit, 0) if limit else 0
+    logs = [log.to_entry() for log in islice(logs, skip, None)]
     
     return {
         "logs": logs,
@@ -603,30 +905,21 @@ async def get_logs(
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates."""
     await websocket.accept()
-    service_manager.websocket_connections.append(websocket)
+    service_manager.websocket_connections.add(websocket)
     
     try:
         # Send initial status
-        status = service_manager.get_status()
-        await websocket.send_text(json.dumps({
-            "type": "status_update",
-            "data": status.dict()
-        }, default=str))
+        await websocket.send_text(service_manager.get_status_message())
         
-        # Keep connection alive
+        # Keepalive is handled by protocol-level ping frames (see uvicorn.run below);
+        # just drain client messages until the socket closes
         while True:
-            # Wait for client messages (ping/pong, etc.)
-            try:
-                await asyncio.wait_for(websocket.receive_text(), timeout=30.0)
-            except asyncio.TimeoutError:
-                # Send ping to keep connection alive
-                await websocket.send_text(json.dumps({"type": "ping"}))
+            await websocket.receive_text()
                 
     except WebSocketDisconnect:
         pass
     finally:
-        if websocket in service_manager.websocket_connections:
-            service_manager.websocket_connections.remove(websocket)
+        service_manager.websocket_connections.discard(websocket)
 
 
 # Serve static files (UI) - only if built
@@ -638,4 +931,4 @@ if ui_dist_path.exists():
 # single entrypoint
 if __name__ == "__main__":
     logging.info("Starting File Organizer API on http://0.0.0.0:8080")
-    uvicorn.run(app, host="0.0.0.0", port=8080)
+    uvicorn.run(app, host="0.0.0.0", port=8080, ws_ping_interval=20, ws_ping_timeout=20)
@@ -5,27 +5,52 @@ Watches a workplace folder and automatically moves signed PDFs to organized dest
 """
 
 import argparse
+import atexit
+import errno
+import functools
+import heapq
+import itertools
 import logging
+import logging.handlers
 import os
+import queue
 import re
 import shutil
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional, Tuple
 from watchdog.observers import Observer
+from watchdog.observers.polling import PollingObserver
 from watchdog.events import FileSystemEventHandler
 
 
+# Characters removed from path segments, as a str.translate deletion table
+_UNSAFE_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
+
 class FilenameParser:
     """Parses PDF filenames according to the specified pattern."""
     
+    # Case-sensitive on purpose: only the '.pdf' tail needs case folding, and
+    # parse_filename normalizes that before matching
     FILENAME_PATTERN = re.compile(
-        r'^(?P<doc>.+?)_(?P<client>.+?)_(?P<date>\d{4}-?\d{2}-?\d{2})_(?P<status>.+?)\.pdf$',
-        re.IGNORECASE
+        r'^(?P<doc>.+?)_(?P<client>.+?)_(?P<date>\d{4}-?\d{2}-?\d{2})_(?P<status>.+?)\.pdf$'
     )
     
     SIGNED_INDICATORS = ['signed', 'executed', 'final']
     
+    # All indicators in one alternation so a single scan classifies the status.
+    # '_signed' is tried first and 'unsigned' before 'signed', so neither is
+    # mistaken for a bare 'signed' match
+    _STATUS_RE = re.compile(
+        r'(?P<tag>_signed)|(?P<unsigned>unsigned)|(?P<signed>%s)'
+        % '|'.join(map(re.escape, SIGNED_INDICATORS)),
+        re.IGNORECASE,
+    )
+    
     @classmethod
     def parse_filename(cls, filename: str) -> Optional[dict]:
         """
@@ -37,12 +62,28 @@ class FilenameParser:
         Returns:
             Dict with doc, client, date, status if valid, None otherwise
         """
+        fields = cls._match_filename(filename)
+        # Copy so callers cannot change the cached result
+        return dict(fields) if fields is not None else None
+    
+    @classmethod
+    @functools.lru_cache(maxsize=4096)
+    def _match_filename(cls, filename: str) -> Optional[dict]:
+        """Memoized parse; the same names recur across events and rescans."""
+        # Reject non-PDFs before the regex runs; '.PDF' and friends are
+        # rewritten so the case-sensitive pattern accepts them
+        suffix = filename[-4:]
+        if suffix != '.pdf':
+            if suffix.lower() != '.pdf':
+                return None
+            filename = filename[:-4] + '.pdf'
         match = cls.FILENAME_PATTERN.match(filename)
         if not match:
             return None
         return match.groupdict()
     
     @classmethod
+    @functools.lru_cache(maxsize=4096)
     def is_signed_status(cls, status: str) -> bool:
         """
         Check if status indicates a signed document.
@@ -53,19 +94,15 @@ class FilenameParser:
         Returns:
             True if status indicates signed document
         """
-        status_lower = status.lower()
-        
-        # Check for explicit _signed tag
-        if '_signed' in status_lower:
+        # An explicit _signed tag wins; otherwise "unsigned" anywhere excludes
+        # the other signed indicators
+        kinds = {match.lastgroup for match in cls._STATUS_RE.finditer(status)}
+        if 'tag' in kinds:
             return True
-            
-        # Check for signed indicators, but exclude "unsigned"
-        if 'unsigned' in status_lower:
-            return False
-            
-        return any(indicator in status_lower for indicator in cls.SIGNED_INDICATORS)
+        return 'signed' in kinds and 'unsigned' not in kinds
     
     @staticmethod
+    @functools.lru_cache(maxsize=4096)
     def normalize_path_segment(segment: str) -> str:
         """
         Normalize a path segment by replacing unsafe characters.
@@ -76,9 +113,9 @@ class FilenameParser:
         Returns:
             Normalized path segment
         """
-        # Replace spaces with underscores and remove/replace unsafe characters
-        normalized = re.sub(r'[<>:"/\\|?*]', '', segment)
-        normalized = re.sub(r'\s+', '_', normalized)
+        # Remove unsafe characters, then replace each whitespace run with one
+        # underscore (split() with no argument splits on runs, like \s+)
+        normalized = '_'.join(segment.translate(_UNSAFE_CHARS).split())
         return normalized.strip('_.')
 
 
@@ -99,50 +136,79 @@ class FileStabilityChecker:
         Returns:
             True if file is stable, False if timeout reached
         """
-        if not filepath.exists():
+        try:
+            stat = os.stat(filepath)
+        except OSError:
             return False
         
-        start_time = time.time()
-        last_size = -1
-        stable_count = 0
-
-        # Adaptive behaviour:
-        # - Use a shorter check interval (up to 0.5s) to react faster on macOS
-        # - If timeout is large (>=5s) allow a single stable check to pass
-        # - Also consider mtime+size heuristic: if size unchanged and mtime older than a small grace
+        # A non-empty file nobody has written to for a check interval is done
+        # already (e.g. it was complete before the watcher saw it): one stat
+        if stat.st_size > 0 and time.time() - stat.st_mtime >= self.check_interval:
+            return True
+        
+        # Otherwise wait until (size, mtime_ns) stays unchanged for one interval;
+        # poll at most every 0.5s to react quickly once the copy finishes
         effective_interval = min(self.check_interval, 0.5)
-        required_stable = 1 if self.timeout >= 5.0 else 2
-        mtime_grace = max(1.0, effective_interval * 2)
-
-        while time.time() - start_time < self.timeout:
+        deadline = time.monotonic() + self.timeout
+        last = (stat.st_size, stat.st_mtime_ns)
+        
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(effective_interval, remaining))
             try:
-                stat = filepath.stat()
-                current_size = stat.st_size
-                mtime = stat.st_mtime
-
-                # Stability check: A file is considered stable for one check if its size
-                # hasn't changed, or if its modification time is old. This avoids
-                # premature detection by combining signals correctly.
-                size_stable = current_size == last_size and current_size > 0
-                mtime_stable = current_size > 0 and (time.time() - mtime) >= mtime_grace
-
-                if size_stable or mtime_stable:
-                    stable_count += 1
-                else:
-                    stable_count = 0
-
-                if stable_count >= required_stable:
-                    return True
-
-                last_size = current_size
-                time.sleep(effective_interval)
-            except (OSError, IOError):
-                # File might be temporarily inaccessible during copy; backoff briefly and reset count
-                stable_count = 0
-                time.sleep(effective_interval)
+                stat = os.stat(filepath)
+            except OSError:
+                # File might be temporarily inaccessible during copy; start over
+                last = None
                 continue
+            
+            current = (stat.st_size, stat.st_mtime_ns)
+            if current == last and stat.st_size > 0:
+                return True
+            last = current
 
-        return False
+
+# Upper bound on destination directories PDFMover remembers as already created
+ENSURED_DIRS_MAX = 1024
+
+# copy_file_range errors meaning "not supported for these files", not "I/O failed"
+_NO_COPY_RANGE_ERRNOS = frozenset({
+    errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP, errno.EBADF,
+})
+
+
+def _copy_file(source_path: Path, dest_file: Path):
+    """
+    Copy contents and metadata with the kernel doing the data transfer.
+    
+    os.copy_file_range (Linux) lets the filesystem reflink or copy server-side;
+    when it is unavailable or refused before any data moved, shutil.copyfile
+    is used, which itself copies through sendfile on Linux.
+    """
+    copy_range = getattr(os, 'copy_file_range', None)
+    if copy_range is not None:
+        with open(source_path, 'rb') as src, open(dest_file, 'wb') as dst:
+            remaining = os.fstat(src.fileno()).st_size
+            copied = 0
+            try:
+                while remaining > 0:
+                    n = copy_range(src.fileno(), dst.fileno(), remaining)
+                    if n == 0:
+                        break
+                    copied += n
+                    remaining -= n
+            except OSError as e:
+                if copied or e.errno not in _NO_COPY_RANGE_ERRNOS:
+                    raise
+                copy_range = None
+        if remaining > 0 and copy_range is not None:
+            # Source shrank or the kernel stopped early; let shutil redo it
+            copy_range = None
+    if copy_range is None:
+        shutil.copyfile(source_path, dest_file)
+    shutil.copystat(source_path, dest_file)
 
 
 class PDFMover:
@@ -152,6 +218,61 @@ class PDFMover:
         self.dest_root = Path(dest_root)
         self.dry_run = dry_run
         self.logger = logging.getLogger(__name__)
+        # LRU of destination directories known to exist; moves may run on
+        # several threads at once, so it is only touched under the lock
+        self._ensured_dirs: OrderedDict = OrderedDict()
+        self._ensured_lock = threading.Lock()
+        # Chosen once: report the move, or perform it
+        self._place = self._report_move if dry_run else self._place_file
+    
+    def _ensure_dir(self, dest_dir: Path):
+        """mkdir -p dest_dir, skipped when it was already created recently."""
+        with self._ensured_lock:
+            if dest_dir in self._ensured_dirs:
+                self._ensured_dirs.move_to_end(dest_dir)
+                return
+        dest_dir.mkdir(parents=True, exist_ok=True)
+        with self._ensured_lock:
+            self._ensured_dirs[dest_dir] = None
+            if len(self._ensured_dirs) > ENSURED_DIRS_MAX:
+                self._ensured_dirs.popitem(last=False)
+    
+    @staticmethod
+    def _move(source_path: Path, dest_file: Path):
+        """Rename in one syscall; copy and delete only across filesystems.
+
+        os.replace, not os.rename: dest_file is the placeholder _reserve
+        created, and os.rename refuses an existing target on Windows.
+        """
+        try:
+            os.replace(source_path, dest_file)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            _copy_file(source_path, dest_file)
+            os.unlink(source_path)
+
+    @staticmethod
+    def _candidates(dest_file: Path):
+        """dest_file, then name_1.pdf, name_2.pdf, ... in the same folder."""
+        yield dest_file
+        stem, suffix = dest_file.stem, dest_file.suffix
+        for i in itertools.count(1):
+            yield dest_file.with_name(f"{stem}_{i}{suffix}")
+
+    def _reserve(self, dest_file: Path) -> Path:
+        """Claim the first free candidate name by creating it with O_EXCL.
+
+        The kernel arbitrates between concurrent movers, so two files can never
+        be given the same name; the empty placeholder is then renamed over.
+        """
+        for candidate in self._candidates(dest_file):
+            try:
+                fd = os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+            except FileExistsError:
+                continue
+            os.close(fd)
+            return candidate
     
     def move_signed_pdf(self, source_path: Path, parsed_info: dict) -> bool:
         """
@@ -172,82 +293,335 @@ class PDFMover:
             status_dir = FilenameParser.normalize_path_segment(parsed_info['status'])
             
             dest_dir = self.dest_root / form_dir / client_dir / date_dir / status_dir
-            dest_file = dest_dir / source_path.name
-            
-            # Handle duplicate filenames
-            if dest_file.exists():
-                timestamp = int(time.time())
-                stem = dest_file.stem
-                suffix = dest_file.suffix
-                dest_file = dest_dir / f"{stem}_{timestamp}{suffix}"
-            
-            if self.dry_run:
-                self.logger.info(f"[DRY RUN] Would move: {source_path} -> {dest_file}")
-                return True
-            
-            # Create destination directory if it doesn't exist
-            dest_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Move the file
-            shutil.move(str(source_path), str(dest_file))
-            self.logger.info(f"Moved: {source_path} -> {dest_file}")
+            self._place(source_path, dest_dir, dest_dir / source_path.name)
             return True
             
         except Exception as e:
             self.logger.error(f"Failed to move {source_path}: {e}")
             return False
+    
+    def _report_move(self, source_path: Path, dest_dir: Path, dest_file: Path):
+        """Dry run: nothing is reserved; report the first free name."""
+        dest_file = next(c for c in self._candidates(dest_file) if not c.exists())
+        self.logger.info(f"[DRY RUN] Would move: {source_path} -> {dest_file}")
+    
+    def _place_file(self, source_path: Path, dest_dir: Path, dest_file: Path):
+        """Move source_path into dest_dir under a unique name."""
+        # Create destination directory if it doesn't exist
+        self._ensure_dir(dest_dir)
+        
+        # Handle duplicate filenames: reserve a unique name, then move onto it
+        try:
+            dest_file = self._reserve(dest_file)
+        except FileNotFoundError:
+            # The cached directory may have been removed behind our back
+            with self._ensured_lock:
+                self._ensured_dirs.pop(dest_dir, None)
+            self._ensure_dir(dest_dir)
+            dest_file = self._reserve(dest_file)
+        try:
+            self._move(source_path, dest_file)
+        except BaseException:
+            os.unlink(dest_file)
+            raise
+        self.logger.info(f"Moved: {source_path} -> {dest_file}")
+
+
+# Quiet period used by the watcher entry points; a path is processed once no
+# new event has arrived for it in this long
+DEBOUNCE_SECONDS = 0.3
+
+# inotify reports close-after-write (IN_CLOSE_WRITE); other backends fall back
+# to stat polling
+CLOSE_EVENTS_SUPPORTED = Observer.__name__ == 'InotifyObserver'
+# How long to wait for a close before falling back to the stability checker
+CLOSE_WAIT_SECONDS = 1.0
+# Debounced paths are processed on this many threads, so one file's
+# stability wait does not hold up the files behind it
+PROCESS_WORKERS = 4
 
 
 class PDFWatchHandler(FileSystemEventHandler):
-    """Handles filesystem events for PDF files in the workplace folder."""
+    """Handles filesystem events for PDF files in the workplace folder.
+
+    With ``debounce_seconds`` > 0, events only record the path; a worker thread
+    hands each path to a pool of ``max_workers`` threads once it has been quiet
+    for that long, so the several events a copy produces for one file cost one
+    parse, stability wait and move, and files are waited on concurrently.
+    With the default of 0 events are processed synchronously.
+    """
     
-    def __init__(self, mover: PDFMover, stability_checker: FileStabilityChecker):
+    def __init__(self, mover: PDFMover, stability_checker: FileStabilityChecker,
+                 debounce_seconds: float = 0.0, close_events: Optional[bool] = None,
+                 max_workers: int = PROCESS_WORKERS):
         self.mover = mover
         self.stability_checker = stability_checker
         self.logger = logging.getLogger(__name__)
+        self.debounce_seconds = debounce_seconds
+        # Whether to wait for close events (polling observers never send them).
+        # Without debouncing the file is processed on the observer's dispatcher
+        # thread, the same thread that would deliver the close, so waiting for
+        # it could only time out
+        if close_events is None:
+            close_events = CLOSE_EVENTS_SUPPORTED and debounce_seconds > 0
+        elif close_events and debounce_seconds <= 0:
+            raise ValueError("close_events requires debounce_seconds > 0")
+        self.close_events = close_events
+        # The handler keys everything by the event's path string and only builds
+        # a Path for files that will actually be moved.
+        # path -> (monotonic deadline of its latest event, whether that was a rename)
+        self._pending: dict = {}
+        # Min-heap of (deadline, path); entries whose deadline no longer matches
+        # _pending were rescheduled or dropped and are skipped when popped
+        self._heap: list = []
+        # Paths currently being processed; a path is never processed twice at once
+        self._in_flight: set = set()
+        self._cond = threading.Condition()
+        self._worker: Optional[threading.Thread] = None
+        self._max_workers = max_workers
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._stopping = False
+        # path -> Event set once the writer closes the file
+        self._closed: dict = {}
+        self._closed_lock = threading.Lock()
     
     def on_created(self, event):
         """Handle file creation events."""
-        if not event.is_directory:
-            self._process_file(Path(event.src_path))
+        # Cheap string check first so non-PDF events are dropped at once
+        if not event.is_directory and event.src_path[-4:].lower() == '.pdf':
+            filepath = event.src_path
+            if self.close_events:
+                with self._closed_lock:
+                    self._closed.setdefault(filepath, threading.Event())
+            self._schedule(filepath)
+
+    def on_closed(self, event):
+        """Handle close-after-write events (inotify only)."""
+        if event.is_directory:
+            return
+        with self._closed_lock:
+            closed = self._closed.get(event.src_path)
+        if closed is not None:
+            closed.set()
     
     def on_moved(self, event):
         """Handle file rename/move events."""
-        if not event.is_directory:
-            self._process_file(Path(event.dest_path))
+        if event.is_directory:
+            return
+        # The old name will never be closed or processed
+        self._forget_closed(event.src_path)
+        if event.dest_path[-4:].lower() == '.pdf':
+            self._schedule(event.dest_path, renamed_from=event.src_path)
+        else:
+            self._forget_pending(event.src_path)
+
+    def on_deleted(self, event):
+        """Handle file deletion events: drop what was kept for the path."""
+        if event.is_directory:
+            return
+        self._forget_closed(event.src_path)
+        self._forget_pending(event.src_path)
+
+    def _forget_pending(self, filepath: str):
+        """Unschedule filepath; its heap entry no longer matches and is skipped."""
+        with self._cond:
+            self._pending.pop(filepath, None)
+
+    def _forget_closed(self, filepath: str):
+        """Drop the close-event entry registered for filepath, if any."""
+        with self._closed_lock:
+            self._closed.pop(filepath, None)
+
+    def stop(self):
+        """Stop the debounce worker; paths still pending are dropped.
+
+        Files already handed to the pool are not waited for: a stability wait
+        can take the checker's whole timeout, and those tasks finish on their
+        own, in the background.
+        """
+        with self._cond:
+            self._stopping = True
+            self._pending.clear()
+            self._heap.clear()
+            self._cond.notify()
+            worker = self._worker
+            pool = self._pool
+        with self._closed_lock:
+            self._closed.clear()
+        if worker is not None and worker is not threading.current_thread():
+            worker.join()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    def _schedule(self, filepath: str, renamed_from: Optional[str] = None):
+        """Process filepath now, or once its events have settled when debouncing.
+
+        A file that arrived by rename is complete (write-then-rename is the safe
+        save idiom), so it skips the stability wait.
+        """
+        is_atomic = renamed_from is not None
+        if self.debounce_seconds <= 0:
+            self._process_file(filepath, is_atomic)
+            return
+        with self._cond:
+            if self._stopping:
+                return
+            # A pending event for the old name is superseded by the rename
+            if renamed_from is not None:
+                self._pending.pop(renamed_from, None)
+            deadline = time.monotonic() + self.debounce_seconds
+            self._pending[filepath] = (deadline, is_atomic)
+            heapq.heappush(self._heap, (deadline, filepath))
+            if self._worker is None:
+                self._executor()
+                self._worker = threading.Thread(
+                    target=self._drain, name='pdf-watch-debounce', daemon=True
+                )
+                self._worker.start()
+            self._cond.notify()
+
+    def _executor(self) -> ThreadPoolExecutor:
+        """The processing pool, created on first use; call with self._cond held."""
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix='pdf-watch'
+            )
+        return self._pool
+
+    def _drain(self):
+        """Worker loop: process each pending path after its quiet period."""
+        while True:
+            with self._cond:
+                while not self._heap and not self._stopping:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                now = time.monotonic()
+                ready = []
+                while self._heap and self._heap[0][0] <= now:
+                    deadline, path = heapq.heappop(self._heap)
+                    entry = self._pending.get(path)
+                    if entry is None or entry[0] != deadline:
+                        continue
+                    if path in self._in_flight:
+                        # Still being processed; look again after another quiet period
+                        deadline = now + self.debounce_seconds
+                        self._pending[path] = (deadline, entry[1])
+                        heapq.heappush(self._heap, (deadline, path))
+                        continue
+                    del self._pending[path]
+                    self._in_flight.add(path)
+                    ready.append((path, entry[1]))
+                if not ready:
+                    if self._heap:
+                        self._cond.wait(self._heap[0][0] - now)
+                    continue
+            for path, is_atomic in ready:
+                self._pool.submit(self._run, path, is_atomic)
+
+    def _run(self, filepath: str, is_atomic: bool):
+        """Pool task: process one debounced path."""
+        try:
+            self._process_file(filepath, is_atomic)
+        except Exception as e:
+            self.logger.error(f"Failed to process {filepath}: {e}")
+        finally:
+            with self._cond:
+                self._in_flight.discard(filepath)
     
-    def _process_file(self, filepath: Path):
+    def _wait_until_written(self, key: str, filepath: Path) -> bool:
+        """True once the writer has closed filepath or its size has settled."""
+        with self._closed_lock:
+            closed = self._closed.get(key)
+        # A file that is already gone will never be closed
+        if closed is not None and filepath.exists() and closed.wait(CLOSE_WAIT_SECONDS):
+            return True
+        return self.stability_checker.wait_for_stability(filepath)
+
+    def _process_file(self, filepath: str, is_atomic: bool = False):
         """Process a potentially new PDF file."""
-        # Only process PDF files
-        if filepath.suffix.lower() != '.pdf':
+        try:
+            self._handle_pdf(filepath, is_atomic)
+        finally:
+            self._forget_closed(filepath)
+
+    def _handle_pdf(self, filepath: str, is_atomic: bool = False):
+        name = os.path.basename(filepath)
+        
+        # Only process PDF files (only the suffix is lowercased, and a bare
+        # '.pdf' has no suffix, as with Path.suffix)
+        if len(name) <= 4 or name[-4:].lower() != '.pdf':
             return
         
         self.logger.info(f"Processing file: {filepath}")
         
-        # Parse filename
-        parsed_info = FilenameParser.parse_filename(filepath.name)
+        # Parse filename; the parsed fields keep their case since they become folder names
+        parsed_info = FilenameParser.parse_filename(name)
         if not parsed_info:
-            self.logger.info(f"Filename doesn't match pattern: {filepath.name}")
+            self.logger.info(f"Filename doesn't match pattern: {name}")
             return
         
         # Check if it's a signed document
         if not FilenameParser.is_signed_status(parsed_info['status']):
-            self.logger.info(f"Document not signed, ignoring: {filepath.name}")
+            self.logger.info(f"Document not signed, ignoring: {name}")
             return
         
-        self.logger.info(f"Found signed document: {filepath.name}")
+        self.logger.info(f"Found signed document: {name}")
+        path = Path(filepath)
         
-        # Wait for file stability
-        if not self.stability_checker.wait_for_stability(filepath):
+        # Wait until the writer is done: the close event, or size stability.
+        # Renamed-in files were complete before the rename.
+        if not is_atomic and not self._wait_until_written(filepath, path):
             self.logger.warning(f"File did not stabilize within timeout: {filepath}")
             return
         
         # Move the file
-        self.mover.move_signed_pdf(filepath, parsed_info)
+        self.mover.move_signed_pdf(path, parsed_info)
+
+
+# Filesystem types whose changes are not reported to local inotify/FSEvents
+NETWORK_FS_TYPES = frozenset({
+    'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'afs', 'ncpfs', 'fuse.sshfs',
+})
+
+
+def is_network_mount(path: Path, mounts_file: str = '/proc/mounts') -> bool:
+    """
+    Check whether path lives on a network filesystem.
+    
+    Args:
+        path: Directory to check
+        mounts_file: Mount table to read (Linux); other platforms report False
+        
+    Returns:
+        True if the mount containing path has a network filesystem type
+    """
+    try:
+        with open(mounts_file) as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+    
+    target = os.path.realpath(path)
+    best, best_type = '', None
+    for mount_point, fs_type in mounts:
+        # The mount table escapes spaces and similar characters as octal
+        mount_point = re.sub(r'\\([0-7]{3})', lambda m: chr(int(m.group(1), 8)), mount_point)
+        prefix = mount_point.rstrip('/') + '/'
+        if (target == mount_point or target.startswith(prefix)) and len(mount_point) >= len(best):
+            best, best_type = mount_point, fs_type
+    return best_type in NETWORK_FS_TYPES
 
 
 def setup_logging(log_file: Optional[str] = None) -> logging.Logger:
-    """Setup logging configuration."""
+    """Setup logging configuration.
+
+    The calling thread only renders the message (QueueHandler.prepare merges
+    msg and args) and enqueues the record; a QueueListener thread applies the
+    timestamped format and writes to the console/file, so watcher threads
+    never wait on handler locks or terminal I/O. The listener is flushed at
+    exit.
+    """
     logger = logging.getLogger()
     logger.setLevel(logging.INFO)
     
@@ -259,13 +633,19 @@ def setup_logging(log_file: Optional[str] = None) -> logging.Logger:
     # Console handler
     console_handler = logging.StreamHandler()
     console_handler.setFormatter(formatter)
-    logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # File handler if specified
     if log_file:
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+    
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    listener = logging.handlers.QueueListener(log_queue, *handlers)
+    listener.start()
+    atexit.register(listener.stop)
     
     return logger
 
@@ -298,6 +678,13 @@ def main():
         '--log-file',
         help='Path to log file (logs to console if not specified)'
     )
+    parser.add_argument(
+        '--poll-interval',
+        type=float,
+        default=5.0,
+        help='Seconds between directory scans when the workplace is on a network '
+             'filesystem and has to be polled (default: 5.0)'
+    )
     
     args = parser.parse_args()
     
@@ -321,10 +708,18 @@ def main():
     # Initialize components
     stability_checker = FileStabilityChecker(timeout=args.stability_timeout)
     mover = PDFMover(dest_root_path, dry_run=args.dry_run)
-    event_handler = PDFWatchHandler(mover, stability_checker)
+    # Network mounts do not deliver native events, so poll them at a chosen rate;
+    # local folders use the platform backend (inotify/FSEvents/ReadDirectoryChangesW)
+    polling = is_network_mount(workplace_path)
+    event_handler = PDFWatchHandler(mover, stability_checker, debounce_seconds=DEBOUNCE_SECONDS,
+                                    close_events=False if polling else None)
     
     # Setup file watcher
-    observer = Observer()
+    if polling:
+        logger.info(f"Workplace is on a network filesystem; polling every {args.poll_interval}s")
+        observer = PollingObserver(timeout=args.poll_interval)
+    else:
+        observer = Observer()
     observer.schedule(event_handler, str(workplace_path), recursive=False)
     observer.start()
     
@@ -337,6 +732,7 @@ def main():
         observer.stop()
     
     observer.join()
+    event_handler.stop()
     logger.info("PDF watcher stopped")
     return 0
 
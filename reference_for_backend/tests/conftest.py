@@ -0,0 +1,34 @@
+"""
+Shared pytest fixtures for the file organizer tests.
+"""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from test_fixtures import TestFixtures, _materialize_dir
+
+
+@pytest.fixture(scope="session")
+def _shared_workplace():
+    """Materialize the sample workplace once per test session, removed after the last test."""
+    with TestFixtures.temp_workplace() as shared:
+        yield shared
+
+
+@pytest.fixture
+def workplace(tmp_path, _shared_workplace) -> Path:
+    """
+    Provide a per-test workplace populated with the sample files.
+    
+    Files are linked from the session copy, so tests may move or delete them
+    but must not modify their contents in place.
+    """
+    target = tmp_path / 'workplace'
+    target.mkdir()
+    _materialize_dir(_shared_workplace, target)
+    return target
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Unit tests for api_server module.
+"""
+
+import unittest
+import asyncio
+import threading
+import tempfile
+import json
+import os
+import shutil
+from unittest.mock import patch
+import sys
+
+# Add src to path so we can import our modules
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+import api_server
+from api_server import Configuration, LogRecordLite, LogRing, ServiceManager
+
+
+def _record(message, level="INFO"):
+    """Build a LogRecordLite with fixed metadata."""
+    return LogRecordLite(0.0, level, message, "test")
+
+
+class TestLogRing(unittest.TestCase):
+    """Test cases for LogRing."""
+
+    def test_capacity_must_be_power_of_two(self):
+        """Test that a capacity the slot mask cannot address is rejected."""
+        with self.assertRaises(ValueError):
+            LogRing(1000)
+
+    def test_append_returns_sequence_numbers(self):
+        """Test that appends are numbered from zero in order."""
+        ring = LogRing(4)
+        self.assertEqual([ring.append(i) for i in range(3)], [0, 1, 2])
+        self.assertEqual(ring.snapshot(), [0, 1, 2])
+        self.assertEqual(len(ring), 3)
+        self.assertEqual(ring.oldest_seq, 0)
+
+    def test_wraparound_evicts_oldest(self):
+        """Test that appending past capacity drops the oldest entries."""
+        ring = LogRing(4)
+        for i in range(10):
+            ring.append(i)
+
+        self.assertEqual(len(ring), 4)
+        self.assertEqual(ring.oldest_seq, 6)
+        self.assertEqual(ring.snapshot(), [6, 7, 8, 9])
+
+    def test_snapshot_ordered_across_capacity_boundary(self):
+        """Test that entries stay oldest-first when the newest sit in low slots."""
+        ring = LogRing(4)
+        for i in range(6):
+            ring.append(f"entry{i}")
+
+        # Slots now hold entry4, entry5, entry2, entry3
+        self.assertEqual(ring.snapshot(), ["entry2", "entry3", "entry4", "entry5"])
+
+    def test_concurrent_appends(self):
+        """Test that concurrent writers get unique sequence numbers and ordered reads."""
+        ring = LogRing(1024)
+        writers = 8
+        per_writer = 500
+        seqs = [[] for _ in range(writers)]
+        start = threading.Barrier(writers)
+        # Switch threads as often as possible so writers interleave
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        self.addCleanup(sys.setswitchinterval, interval)
+
+        def write(tid):
+            start.wait()
+            for i in range(per_writer):
+                seqs[tid].append(ring.append((tid, i)))
+
+        threads = [threading.Thread(target=write, args=(tid,)) for tid in range(writers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        claimed = sorted(seq for chunk in seqs for seq in chunk)
+        self.assertEqual(claimed, list(range(writers * per_writer)))
+        self.assertEqual(len(ring), 1024)
+
+        snapshot = ring.snapshot()
+        self.assertEqual(len(snapshot), 1024)
+        self.assertEqual(len(set(snapshot)), 1024)
+        # Oldest-first order preserves each writer's own append order
+        for tid in range(writers):
+            own = [i for t, i in snapshot if t == tid]
+            self.assertEqual(own, sorted(own))
+
+
+class TestLevelFilteredLogs(unittest.TestCase):
+    """Test cases for level-filtered reads through /api/v1/logs."""
+
+    def setUp(self):
+        """Set up a fresh service manager for each test."""
+        self.manager = ServiceManager()
+        patcher = patch.object(api_server, 'service_manager', self.manager)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _get_logs(self, **kwargs):
+        params = {"level": None, "limit": 100, "search": None}
+        params.update(kwargs)
+        return asyncio.run(api_server.get_logs(**params))
+
+    def test_level_filter_returns_only_that_level(self):
+        """Test that a level filter reads that level's entries in order."""
+        for i in range(5):
+            self.manager.add_log_entry(_record(f"info{i}"))
+            self.manager.add_log_entry(_record(f"error{i}", "ERROR"))
+
+        result = self._get_logs(level="error")
+        self.assertEqual([log.message for log in result["logs"]], [f"error{i}" for i in range(5)])
+        self.assertTrue(all(log.level == "ERROR" for log in result["logs"]))
+
+    def test_level_filter_unknown_level(self):
+        """Test that a level with no entries returns an empty list."""
+        self.manager.add_log_entry(_record("info"))
+
+        self.assertEqual(self._get_logs(level="DEBUG")["logs"], [])
+
+    def test_level_filter_skips_entries_evicted_from_log(self):
+        """Test that a level ring never returns entries older than log_entries holds."""
+        capacity = self.manager.log_entries._mask + 1
+        self.manager.add_log_entry(_record("old error", "ERROR"))
+        for i in range(capacity):
+            self.manager.add_log_entry(_record(f"info{i}"))
+        self.manager.add_log_entry(_record("new error", "ERROR"))
+
+        result = self._get_logs(level="ERROR")
+        self.assertEqual([log.message for log in result["logs"]], ["new error"])
+
+    def test_level_filter_limit_keeps_newest(self):
+        """Test that the limit returns the newest entries of the level."""
+        for i in range(5):
+            self.manager.add_log_entry(_record(f"warn{i}", "WARNING"))
+
+        result = self._get_logs(level="WARNING", limit=2)
+        self.assertEqual([log.message for log in result["logs"]], ["warn3", "warn4"])
+
+
+class TestStatusJson(unittest.TestCase):
+    """Test cases for ServiceManager.get_status_json caching."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.workplace = os.path.join(self.temp_dir, 'workplace')
+        self.destination = os.path.join(self.temp_dir, 'destination')
+        os.makedirs(self.workplace)
+        os.makedirs(self.destination)
+        self.manager = ServiceManager()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def _config(self, workplace=None):
+        return Configuration.model_validate(
+            {"workplace_path": workplace or self.workplace, "destination_root": self.destination},
+            context={"trusted": True},
+        )
+
+    def _status(self):
+        return json.loads(self.manager.get_status_json())
+
+    def _run(self, coro):
+        async def run():
+            try:
+                await coro
+            finally:
+                await self.manager.stop_broadcaster()
+        asyncio.run(run())
+
+    def test_start_and_stop_are_reflected(self):
+        """Test that the cached status follows start and stop."""
+        self.assertEqual(self._status()["status"], "stopped")
+
+        self._run(self.manager.start_service(self._config()))
+        status = self._status()
+        self.assertEqual(status["status"], "running")
+        self.assertIsNotNone(status["uptime_seconds"])
+        self.assertIsNone(status["last_error"])
+
+        self._run(self.manager.stop_service())
+        status = self._status()
+        self.assertEqual(status["status"], "stopped")
+        self.assertIsNone(status["uptime_seconds"])
+
+    def test_start_failure_is_reflected(self):
+        """Test that a failed start shows the error state and message."""
+        self._status()
+        with self.assertRaises(api_server.HTTPException):
+            self._run(self.manager.start_service(self._config(os.path.join(self.temp_dir, 'missing'))))
+
+        status = self._status()
+        self.assertEqual(status["status"], "error")
+        self.assertTrue(status["last_error"])
+
+    def test_counter_changes_are_reflected(self):
+        """Test that in-place counter updates show up once marked dirty."""
+        self._status()
+
+        async def bump():
+            self.manager.files_processed_today += 1
+            self.manager.queue_size += 3
+            self.manager.mark_status_dirty()
+        self._run(bump())
+
+        status = self._status()
+        self.assertEqual(status["files_processed_today"], 1)
+        self.assertEqual(status["queue_size"], 3)
+
+    def test_configuration_assignment_resets_caches(self):
+        """Test that a new configuration drops the cached config JSON and mover."""
+        self.manager.configuration = self._config()
+        first_json = self.manager.get_config_json()
+        first_mover = self.manager.get_mover()
+
+        other = os.path.join(self.temp_dir, 'other')
+        os.makedirs(other)
+        self.manager.configuration = self._config(other)
+
+        self.assertNotEqual(self.manager.get_config_json(), first_json)
+        self.assertIsNot(self.manager.get_mover(), first_mover)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the test fixture helpers.
+"""
+
+import unittest
+import tempfile
+import os
+import shutil
+from pathlib import Path
+from unittest.mock import patch
+import errno
+import sys
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+import test_fixtures
+from test_fixtures import TestFixtures
+
+
+class TestCreateTempWorkplace(unittest.TestCase):
+    """Test cases for TestFixtures.create_temp_workplace."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_copies_every_fixture_file(self):
+        """Test that every sample workplace file is copied byte-for-byte."""
+        workplace = TestFixtures.create_temp_workplace(self.temp_dir)
+        
+        sample = TestFixtures.get_sample_workplace()
+        expected = sorted(p.name for p in sample.iterdir() if p.is_file())
+        self.assertEqual(sorted(p.name for p in workplace.iterdir()), expected)
+        for name in expected:
+            self.assertEqual((workplace / name).read_bytes(), (sample / name).read_bytes())
+
+    
+    def test_copies_when_links_are_unavailable(self):
+        """Test that the workplace falls back to copies when hardlinking fails."""
+        with patch('os.link', side_effect=OSError(errno.EXDEV, 'cross-device')):
+            workplace = TestFixtures.create_temp_workplace(self.temp_dir)
+        
+        sample = TestFixtures.get_sample_workplace()
+        expected = sorted(p.name for p in sample.iterdir() if p.is_file())
+        self.assertEqual(sorted(p.name for p in workplace.iterdir()), expected)
+        for name in expected:
+            self.assertEqual((workplace / name).read_bytes(), (sample / name).read_bytes())
+            self.assertFalse(os.path.samefile(workplace / name, sample / name))
+    
+    def test_repeated_creation_leaves_fixtures_intact(self):
+        """Test that recreating a workplace never truncates the shared fixtures."""
+        sample = TestFixtures.get_sample_workplace()
+        before = {p.name: p.read_bytes() for p in sample.iterdir() if p.is_file()}
+        
+        TestFixtures.create_temp_workplace(self.temp_dir)
+        TestFixtures.create_temp_workplace(self.temp_dir)
+        
+        after = {p.name: p.read_bytes() for p in sample.iterdir() if p.is_file()}
+        self.assertEqual(after, before)
+
+    
+    def test_temp_workplace_context(self):
+        """Test that temp_workplace cleans up its temporary directory on exit."""
+        with TestFixtures.temp_workplace() as workplace:
+            self.assertTrue(any(workplace.iterdir()))
+            root = workplace.parent
+        self.assertFalse(root.exists())
+
+
+class TestCreateTestPdf(unittest.TestCase):
+    """Test cases for TestFixtures.create_test_pdf."""
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = Path(tempfile.mkdtemp())
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_default_content_is_pdf(self):
+        """Test that the default content carries the PDF magic header."""
+        pdf = TestFixtures.create_test_pdf(self.temp_dir / 'nested' / 'doc.pdf')
+        data = pdf.read_bytes()
+        self.assertTrue(data.startswith(b'%PDF-'))
+        self.assertTrue(data.rstrip().endswith(b'%%EOF'))
+    
+    def test_string_content_is_encoded(self):
+        """Test that string content is still accepted."""
+        pdf = TestFixtures.create_test_pdf(self.temp_dir / 'doc.pdf', 'Test PDF content')
+        self.assertEqual(pdf.read_text(), 'Test PDF content')
+
+    
+    def test_recreates_removed_parent(self):
+        """Test that a cached parent directory removed later is recreated."""
+        nested = self.temp_dir / 'nested'
+        TestFixtures.create_test_pdf(nested / 'first.pdf')
+        shutil.rmtree(nested)
+        
+        pdf = TestFixtures.create_test_pdf(nested / 'second.pdf')
+        self.assertTrue(pdf.exists())
+    
+    def test_bulk_creation(self):
+        """Test that create_test_pdfs writes every file with shared content."""
+        names = [f'contract_Client{i}_2024-01-01_signed.pdf' for i in range(20)]
+        paths = TestFixtures.create_test_pdfs(self.temp_dir / 'bulk', names)
+        
+        self.assertEqual([p.name for p in paths], names)
+        for path in paths:
+            self.assertEqual(path.read_bytes(), test_fixtures._MINIMAL_PDF)
+
+
+
+class TestSampleFilenames(unittest.TestCase):
+    """Test cases for the sample filename accessors."""
+    
+    def test_signed_samples(self):
+        """Test the signed view."""
+        self.assertEqual(TestFixtures.get_signed_samples(), (
+            "contract_StartupAlpha_2024-08-21_signed.pdf",
+            "NDA_TechCorp_20240815_executed.pdf",
+            "employment_John_Doe_LLC_2024-06-15_fully_signed.pdf",
+            "service_ClientBeta_2024-07-30_final.pdf",
+        ))
+    
+    def test_invalid_samples(self):
+        """Test the invalid view."""
+        self.assertEqual(TestFixtures.get_invalid_samples(), ("invalid_filename.pdf", "not_a_pdf.txt"))
+
+
+def test_workplace_fixture(workplace):
+    """Test that the workplace fixture exposes the sample files per test."""
+    sample = TestFixtures.get_sample_workplace()
+    expected = sorted(p.name for p in sample.iterdir() if p.is_file())
+    assert sorted(p.name for p in workplace.iterdir()) == expected
+    
+    # Moving a file out must not affect the shared session copy
+    moved = workplace / expected[0]
+    moved.rename(workplace.parent / expected[0])
+    assert not moved.exists()
+
+
+def test_workplace_fixture_is_fresh_per_test(workplace):
+    """Test that files moved by a previous test are present again."""
+    sample = TestFixtures.get_sample_workplace()
+    assert len(list(workplace.iterdir())) == len([p for p in sample.iterdir() if p.is_file()])
+
+
+if __name__ == '__main__':
+    unittest.main()
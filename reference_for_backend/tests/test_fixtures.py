@@ -2,38 +2,112 @@
 Test utilities and fixtures for the file organizer tests.
 """
 
+import contextlib
 import os
 from pathlib import Path
 import shutil
 import tempfile
 
 
+# Fixture locations, resolved once at import time
+_FIXTURES_DIR = (Path(__file__).parent / 'fixtures').resolve()
+_SAMPLE_WORKPLACE = _FIXTURES_DIR / 'workplace'
+_SAMPLE_DESTINATION = _FIXTURES_DIR / 'destination'
+_SAMPLE_WORKPLACE_STR = os.fspath(_SAMPLE_WORKPLACE)
+
+# Parent directories already created by create_test_pdf
+_DIRS_CREATED: set[Path] = set()
+
+# Smallest byte sequence that still starts with the PDF magic header
+_MINIMAL_PDF = b"%PDF-1.4\n1 0 obj<<>>endobj\ntrailer<<>>\n%%EOF\n"
+
+# Sample filenames for testing; callers that need to mutate should copy with list()
+_SAMPLE_FILENAMES = (
+    "contract_StartupAlpha_2024-08-21_signed.pdf",
+    "NDA_TechCorp_20240815_executed.pdf",
+    "employment_John_Doe_LLC_2024-06-15_fully_signed.pdf",
+    "service_ClientBeta_2024-07-30_final.pdf",
+    "contract_StartupGamma_2024-08-20_draft.pdf",  # Not signed
+    "invalid_filename.pdf",  # Invalid format
+    "not_a_pdf.txt"  # Not a PDF
+)
+
+# Categorized views of the sample filenames, computed once
+_SIGNED_SAMPLES = tuple(
+    f for f in _SAMPLE_FILENAMES if "signed" in f or "executed" in f or "final" in f
+)
+_INVALID_SAMPLES = tuple(
+    f for f in _SAMPLE_FILENAMES if "invalid" in f or not f.endswith(".pdf")
+)
+
+
+def _materialize(src: str, dst: str) -> None:
+    """
+    Make src available at dst, hardlinking when possible.
+    
+    Fixture files are read-only inputs, so sharing the inode is safe as long
+    as tests move or delete workplace files rather than writing into them.
+    Falls back to a copy across filesystems or where links are unsupported.
+    
+    Args:
+        src: Source fixture file path
+        dst: Destination file path
+    """
+    try:
+        # Never write through an existing link into the shared fixture
+        os.unlink(dst)
+    except FileNotFoundError:
+        pass
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
+
+
+def _materialize_dir(src_dir, dst_dir) -> None:
+    """
+    Materialize every regular file directly inside src_dir into dst_dir.
+    
+    Args:
+        src_dir: Directory containing the files to materialize
+        dst_dir: Existing directory to materialize them into
+    """
+    dst_dir = os.fspath(dst_dir)
+    with os.scandir(src_dir) as it:
+        for entry in it:
+            if entry.is_file(follow_symlinks=False):
+                _materialize(entry.path, os.path.join(dst_dir, entry.name))
+
+
 class TestFixtures:
     """Helper class for managing test fixtures."""
     
     @classmethod
     def get_fixtures_dir(cls) -> Path:
         """Get the path to the test fixtures directory."""
-        return Path(__file__).parent / 'fixtures'
+        return _FIXTURES_DIR
     
     @classmethod
     def get_sample_workplace(cls) -> Path:
         """Get the path to sample workplace files."""
-        return cls.get_fixtures_dir() / 'workplace'
+        return _SAMPLE_WORKPLACE
     
     @classmethod
     def get_sample_destination(cls) -> Path:
         """Get the path to sample destination structure."""
-        return cls.get_fixtures_dir() / 'destination'
+        return _SAMPLE_DESTINATION
     
     @classmethod
     def create_temp_workplace(cls, temp_dir: Path) -> Path:
         """
         Create a temporary workplace directory with sample files.
         
+        Files are hardlinked from the fixtures where possible (copied otherwise);
+        tests must not modify their contents in place.
+        
         Args:
             temp_dir: Temporary directory to create workplace in
-            
+        
         Returns:
             Path to the created workplace directory
         """
@@ -41,39 +115,82 @@ class TestFixtures:
         workplace.mkdir(exist_ok=True)
         
         # Copy sample files from fixtures
-        fixtures_workplace = cls.get_sample_workplace()
-        if fixtures_workplace.exists():
-            for file_path in fixtures_workplace.iterdir():
-                if file_path.is_file():
-                    shutil.copy2(file_path, workplace)
+        if os.path.isdir(_SAMPLE_WORKPLACE_STR):
+            _materialize_dir(_SAMPLE_WORKPLACE_STR, workplace)
         
         return workplace
     
     @classmethod
-    def create_test_pdf(cls, filepath: Path, content: str = "Test PDF content") -> Path:
+    @contextlib.contextmanager
+    def temp_workplace(cls):
+        """
+        Create a sample workplace inside a temporary directory for the duration of a block.
+        
+        The temporary directory (and the workplace in it) is removed on exit.
+        
+        Yields:
+            Path to the created workplace directory
+        """
+        with tempfile.TemporaryDirectory(prefix="fo_", ignore_cleanup_errors=True) as td:
+            yield cls.create_temp_workplace(Path(td))
+    
+    @classmethod
+    def create_test_pdf(cls, filepath: Path, content: bytes | str = _MINIMAL_PDF) -> Path:
         """
         Create a test PDF file with given content.
         
         Args:
             filepath: Path where to create the file
-            content: Content to write to the file
-            
+            content: Content to write to the file; defaults to a minimal valid PDF.
+                Strings are UTF-8 encoded.
+        
         Returns:
             Path to the created file
         """
-        filepath.parent.mkdir(parents=True, exist_ok=True)
-        filepath.write_text(content)
+        data = content.encode() if isinstance(content, str) else content
+        parent = filepath.parent
+        if parent not in _DIRS_CREATED:
+            parent.mkdir(parents=True, exist_ok=True)
+            _DIRS_CREATED.add(parent)
+        try:
+            filepath.write_bytes(data)
+        except FileNotFoundError:
+            # The cached directory was removed (e.g. by a tearDown); recreate it
+            parent.mkdir(parents=True, exist_ok=True)
+            filepath.write_bytes(data)
         return filepath
     
     @classmethod
-    def get_sample_filenames(cls) -> list[str]:
-        """Get a list of sample PDF filenames for testing."""
-        return [
-            "contract_StartupAlpha_2024-08-21_signed.pdf",
-            "NDA_TechCorp_20240815_executed.pdf", 
-            "employment_John_Doe_LLC_2024-06-15_fully_signed.pdf",
-            "service_ClientBeta_2024-07-30_final.pdf",
-            "contract_StartupGamma_2024-08-20_draft.pdf",  # Not signed
-            "invalid_filename.pdf",  # Invalid format
-            "not_a_pdf.txt"  # Not a PDF
-        ]
+    def create_test_pdfs(cls, dirpath: Path, names, content: bytes | str = _MINIMAL_PDF) -> list[Path]:
+        """
+        Create many test PDF files in one directory with the same content.
+        
+        Args:
+            dirpath: Directory to create the files in
+            names: Filenames to create inside dirpath
+            content: Content shared by every file; strings are UTF-8 encoded
+        
+        Returns:
+            List of paths to the created files, in the order given
+        """
+        data = content.encode() if isinstance(content, str) else content
+        dirpath.mkdir(parents=True, exist_ok=True)
+        paths = [dirpath / name for name in names]
+        for path in paths:
+            path.write_bytes(data)
+        return paths
+    
+    @classmethod
+    def get_sample_filenames(cls) -> tuple[str, ...]:
+        """Get the sample PDF filenames for testing."""
+        return _SAMPLE_FILENAMES
+    
+    @classmethod
+    def get_signed_samples(cls) -> tuple[str, ...]:
+        """Get the sample filenames that carry a signed status."""
+        return _SIGNED_SAMPLES
+    
+    @classmethod
+    def get_invalid_samples(cls) -> tuple[str, ...]:
+        """Get the sample filenames that are not valid PDF names."""
+        return _INVALID_SAMPLES
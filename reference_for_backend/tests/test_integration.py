@@ -74,7 +74,7 @@ class TestPDFWorkflowIntegration(unittest.TestCase):
         self.assertEqual(moved_content, 'Mock PDF content for testing')
     
     def test_duplicate_file_handling(self):
-        """Test handling of duplicate files with timestamp suffix."""
+        """Test handling of duplicate files with a numbered suffix."""
         test_filename = 'NDA_ClientCorp_20240815_executed.pdf'
         
         # Create the first file
@@ -96,24 +96,26 @@ class TestPDFWorkflowIntegration(unittest.TestCase):
         test_file2 = self.workplace / test_filename
         test_file2.write_text('Second file content')
         
-        # Move second file - should get timestamp suffix
+        # Move second file - should get a numbered suffix
         success2 = self.mover.move_signed_pdf(test_file2, parsed_info)
         self.assertTrue(success2)
         
         # Verify both files exist in destination
         dest_dir = self.destination / 'NDA' / 'ClientCorp' / '20240815' / 'executed'
-        files_in_dest = list(dest_dir.glob('*.pdf'))
+        # scandir names come straight from readdir: no per-entry stat or fnmatch
+        with os.scandir(dest_dir) as entries:
+            filenames = [e.name for e in entries if e.name.endswith('.pdf')]
         
-        self.assertEqual(len(files_in_dest), 2, "Should have 2 files in destination")
+        self.assertEqual(len(filenames), 2, "Should have 2 files in destination")
         
-        # One should be original name, one should have timestamp
-        filenames = [f.name for f in files_in_dest]
+        # One should be original name, one should have a suffix
         self.assertIn(test_filename, filenames, "Original filename should exist")
         
-        # Check that one file has timestamp suffix
+        # Check that one file has the first free suffix
         timestamped_files = [f for f in filenames if f != test_filename]
         self.assertEqual(len(timestamped_files), 1, "Should have one timestamped file")
         self.assertTrue(timestamped_files[0].startswith('NDA_ClientCorp_20240815_executed_'))
+        self.assertEqual(timestamped_files[0], 'NDA_ClientCorp_20240815_executed_1.pdf')
     
     def test_dry_run_workflow(self):
         """Test the complete workflow in dry-run mode."""
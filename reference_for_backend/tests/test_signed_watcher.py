@@ -8,13 +8,58 @@ import tempfile
 import os
 import shutil
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 import sys
 
 # Add src to path so we can import our modules
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
-from signed_watcher import FilenameParser, PDFMover, PDFWatchHandler, FileStabilityChecker
+from signed_watcher import FilenameParser, PDFMover, PDFWatchHandler, FileStabilityChecker, is_network_mount
+
+
+class _FakeMover:
+    """Records move_signed_pdf calls."""
+    
+    def __init__(self):
+        self.calls = []
+    
+    def move_signed_pdf(self, *args):
+        self.calls.append(args)
+        return True
+
+
+class _FakeStabilityChecker:
+    """Records wait_for_stability calls and returns a fixed result."""
+    
+    def __init__(self, result=True):
+        self.result = result
+        self.calls = []
+    
+    def wait_for_stability(self, filepath):
+        self.calls.append(filepath)
+        return self.result
+
+
+# tmpfs when available, so scratch files never reach the disk
+_SCRATCH_ROOT = '/dev/shm' if os.access('/dev/shm', os.W_OK) else None
+
+
+class _ScratchDirTestCase(unittest.TestCase):
+    """One temp directory per class; each test gets its own subdirectory in it."""
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._base_dir = tempfile.mkdtemp(dir=_SCRATCH_ROOT)
+    
+    @classmethod
+    def tearDownClass(cls):
+        shutil.rmtree(cls._base_dir, ignore_errors=True)
+        super().tearDownClass()
+    
+    def setUp(self):
+        self.temp_dir = os.path.join(self._base_dir, self._testMethodName)
+        os.mkdir(self.temp_dir)
 
 
 class TestFilenameParser(unittest.TestCase):
@@ -58,6 +103,12 @@ class TestFilenameParser(unittest.TestCase):
         result = FilenameParser.parse_filename(filename)
         self.assertIsNone(result)
     
+    def test_parse_filename_result_is_not_shared(self):
+        """Test that mutating a parse result does not affect later parses."""
+        filename = "contract_StartupAlpha_2024-08-21_signed.pdf"
+        FilenameParser.parse_filename(filename)['client'] = 'Changed'
+        self.assertEqual(FilenameParser.parse_filename(filename)['client'], 'StartupAlpha')
+    
     def test_is_signed_status_signed(self):
         """Test signed status detection for 'signed'."""
         self.assertTrue(FilenameParser.is_signed_status('signed'))
@@ -83,6 +134,8 @@ class TestFilenameParser(unittest.TestCase):
         self.assertFalse(FilenameParser.is_signed_status('draft'))
         self.assertFalse(FilenameParser.is_signed_status('pending'))
         self.assertFalse(FilenameParser.is_signed_status('review'))
+        self.assertFalse(FilenameParser.is_signed_status('unsigned'))
+        self.assertFalse(FilenameParser.is_signed_status('Unsigned_Final'))
 
     def test_normalize_path_segment(self):
         """Test path segment normalization."""
@@ -96,18 +149,14 @@ class TestFilenameParser(unittest.TestCase):
         self.assertEqual(FilenameParser.normalize_path_segment('Client/Name'), 'ClientName')
 
 
-class TestFileStabilityChecker(unittest.TestCase):
+class TestFileStabilityChecker(_ScratchDirTestCase):
     """Test cases for FileStabilityChecker class."""
     
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.checker = FileStabilityChecker(timeout=0.5, check_interval=0.1)
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
-    
     def test_file_stability_stable_file(self):
         """Test stability check for a stable file."""
         # Create a test file
@@ -115,8 +164,40 @@ class TestFileStabilityChecker(unittest.TestCase):
         with open(test_file, 'w') as f:
             f.write('test content')
         
-        # File should be stable
-        self.assertTrue(self.checker.wait_for_stability(Path(test_file)))
+        # File should be stable; skip the real polling sleeps
+        with patch('signed_watcher.time.sleep'):
+            self.assertTrue(self.checker.wait_for_stability(Path(test_file)))
+    
+    def test_file_stability_old_file_is_immediate(self):
+        """Test that a file untouched for a check interval needs no polling."""
+        import time
+        test_file = os.path.join(self.temp_dir, 'old.pdf')
+        with open(test_file, 'w') as f:
+            f.write('test content')
+        old = time.time() - 60
+        os.utime(test_file, (old, old))
+        
+        with patch('signed_watcher.time.sleep') as mock_sleep:
+            self.assertTrue(self.checker.wait_for_stability(Path(test_file)))
+        mock_sleep.assert_not_called()
+    
+    def test_file_stability_growing_file_times_out(self):
+        """Test that a file still growing at the deadline is reported unstable."""
+        import itertools
+        import time
+        sizes = itertools.count(100, 100)
+        
+        def growing_stat(path):
+            # mode, ino, dev, nlink, uid, gid, size, atime, mtime, ctime
+            now = time.time()
+            return os.stat_result((0o100644, 0, 0, 1, 0, 0, next(sizes), now, now, now))
+        
+        # A fake clock advances 0.2s per reading, so the 0.5s timeout needs no real waiting
+        with patch('signed_watcher.os.stat', side_effect=growing_stat), \
+             patch('signed_watcher.time.sleep') as mock_sleep, \
+             patch('signed_watcher.time.monotonic', side_effect=itertools.count(0, 0.2)):
+            self.assertFalse(self.checker.wait_for_stability(Path(self.temp_dir) / 'growing.pdf'))
+        self.assertGreater(mock_sleep.call_count, 0)
     
     def test_file_stability_nonexistent_file(self):
         """Test stability check for nonexistent file."""
@@ -126,86 +207,108 @@ class TestFileStabilityChecker(unittest.TestCase):
         self.assertFalse(self.checker.wait_for_stability(Path(test_file)))
 
 
-class TestPDFMover(unittest.TestCase):
+class TestPDFMover(_ScratchDirTestCase):
     """Test cases for PDFMover class."""
     
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Written once; each test hard-links it in as its source file
+        cls._template = Path(cls._base_dir) / 'template.pdf'
+        cls._template.write_text('test content')
+    
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.workplace = os.path.join(self.temp_dir, 'workplace')
         self.destination = os.path.join(self.temp_dir, 'destination')
         os.makedirs(self.workplace)
         os.makedirs(self.destination)
         
         self.mover = PDFMover(self.destination)
+        self.test_file = Path(self.workplace) / 'contract_Test_2024-01-01_signed.pdf'
+        os.link(self._template, self.test_file)
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
-    
-    def test_move_signed_pdf_dry_run(self):
-        """Test PDF moving in dry run mode."""
-        # Create mover in dry run mode
-        mover = PDFMover(self.destination, dry_run=True)
-        
-        # Create test file
-        test_file = Path(self.workplace) / 'contract_Test_2024-01-01_signed.pdf'
-        test_file.write_text('test content')
-        
+    def test_move_scenarios(self):
+        """Test real and dry-run moves against the same source and destination."""
         parsed = {
             'doc': 'contract',
             'client': 'Test',
             'date': '2024-01-01',
             'status': 'signed'
         }
+        expected_path = Path(self.destination) / 'contract' / 'Test' / '2024-01-01' / 'signed' / 'contract_Test_2024-01-01_signed.pdf'
         
-        # Process should succeed but not move file
-        result = mover.move_signed_pdf(test_file, parsed)
-        self.assertTrue(result)
-        self.assertTrue(test_file.exists())  # File should still exist
+        # (name, dry_run, source kept, destination written); the dry run goes
+        # first so it sees an empty destination
+        cases = [
+            ('dry_run', True, True, False),
+            ('move', False, False, True),
+        ]
+        for name, dry_run, source_kept, dest_written in cases:
+            with self.subTest(name=name):
+                if not self.test_file.exists():
+                    os.link(self._template, self.test_file)
+                mover = PDFMover(self.destination, dry_run=dry_run)
+                
+                self.assertTrue(mover.move_signed_pdf(self.test_file, parsed))
+                self.assertEqual(self.test_file.exists(), source_kept)
+                self.assertEqual(expected_path.exists(), dest_written)
     
-    def test_move_signed_pdf_success(self):
-        """Test successful PDF moving."""
-        # Create test file
-        test_file = Path(self.workplace) / 'contract_Test_2024-01-01_signed.pdf'
-        test_file.write_text('test content')
+    def test_move_same_filesystem_is_one_rename(self):
+        """Test that a same-filesystem move is a single rename, with no copy."""
+        parsed = {'doc': 'contract', 'client': 'Test', 'date': '2024-01-01', 'status': 'signed'}
         
-        parsed = {
-            'doc': 'contract',
-            'client': 'Test',
-            'date': '2024-01-01',
-            'status': 'signed'
-        }
+        with patch('signed_watcher.os.replace', wraps=os.replace) as mock_replace, \
+             patch('signed_watcher._copy_file') as mock_copy:
+            self.assertTrue(self.mover.move_signed_pdf(self.test_file, parsed))
+        
+        mock_replace.assert_called_once()
+        mock_copy.assert_not_called()
+    
+    def test_move_onto_reserved_placeholder(self):
+        """Test that the move replaces the placeholder _reserve created."""
+        dest_dir = Path(self.destination) / 'reserved'
+        dest_dir.mkdir()
+        placeholder = self.mover._reserve(dest_dir / self.test_file.name)
+        self.assertEqual(placeholder.stat().st_size, 0)
         
-        result = self.mover.move_signed_pdf(test_file, parsed)
-        self.assertTrue(result)
+        # os.replace overwrites the existing placeholder on every platform
+        with patch('signed_watcher.os.replace', wraps=os.replace) as replace:
+            self.mover._move(self.test_file, placeholder)
         
-        # Check that file was moved to correct location
-        expected_path = Path(self.destination) / 'contract' / 'Test' / '2024-01-01' / 'signed' / 'contract_Test_2024-01-01_signed.pdf'
-        self.assertTrue(expected_path.exists())
-        self.assertFalse(test_file.exists())  # Original should be gone
-
+        replace.assert_called_once_with(self.test_file, placeholder)
+        self.assertEqual(placeholder.read_text(), 'test content')
+        self.assertFalse(self.test_file.exists())
+    
+    def test_move_across_filesystems_copies(self):
+        """Test that EXDEV from replace falls back to copy and unlink."""
+        import errno
+        parsed = {'doc': 'contract', 'client': 'Test', 'date': '2024-01-01', 'status': 'signed'}
+        
+        with patch('signed_watcher.os.replace', side_effect=OSError(errno.EXDEV, 'cross-device')):
+            self.assertTrue(self.mover.move_signed_pdf(self.test_file, parsed))
+        
+        expected_path = Path(self.destination) / 'contract' / 'Test' / '2024-01-01' / 'signed' / self.test_file.name
+        self.assertEqual(expected_path.read_text(), 'test content')
+        self.assertFalse(self.test_file.exists())
 
-class TestPDFWatchHandler(unittest.TestCase):
+class TestPDFWatchHandler(_ScratchDirTestCase):
     """Test cases for PDFWatchHandler class."""
     
     def setUp(self):
         """Set up test fixtures."""
-        self.temp_dir = tempfile.mkdtemp()
+        super().setUp()
         self.workplace = os.path.join(self.temp_dir, 'workplace')
         self.destination = os.path.join(self.temp_dir, 'destination')
         os.makedirs(self.workplace)
         os.makedirs(self.destination)
         
-        # Create mocks
-        self.mover = MagicMock()
-        self.stability_checker = MagicMock()
+        # Create fakes
+        self.mover = _FakeMover()
+        self.stability_checker = _FakeStabilityChecker()
         self.handler = PDFWatchHandler(self.mover, self.stability_checker)
     
-    def tearDown(self):
-        """Clean up test fixtures."""
-        shutil.rmtree(self.temp_dir)
-    
     def test_on_created_with_pdf(self):
         """Test file creation event with PDF."""
         # Create a mock event
@@ -213,9 +316,6 @@ class TestPDFWatchHandler(unittest.TestCase):
         test_file = os.path.join(self.workplace, 'test.pdf')
         event = FileCreatedEvent(test_file)
         
-        # Mock stability checker to return True
-        self.stability_checker.wait_for_stability.return_value = True
-        
         # Mock FilenameParser methods
         with patch('signed_watcher.FilenameParser.parse_filename') as mock_parse, \
              patch('signed_watcher.FilenameParser.is_signed_status') as mock_signed:
@@ -226,7 +326,7 @@ class TestPDFWatchHandler(unittest.TestCase):
             self.handler.on_created(event)
             
             # Should have called the process chain
-            self.stability_checker.wait_for_stability.assert_called_once()
+            self.assertEqual(len(self.stability_checker.calls), 1)
     
     def test_on_created_with_non_pdf(self):
         """Test file creation event with non-PDF."""
@@ -237,7 +337,166 @@ class TestPDFWatchHandler(unittest.TestCase):
         self.handler.on_created(event)
         
         # Should not process non-PDF files
-        self.stability_checker.wait_for_stability.assert_not_called()
+        self.assertEqual(self.stability_checker.calls, [])
+
+    def test_on_moved_skips_stability_wait(self):
+        """Test that a file renamed into place is moved without a stability wait."""
+        from watchdog.events import FileMovedEvent
+        tmp_file = os.path.join(self.workplace, 'contract_Test_2024-01-01_signed.tmp')
+        test_file = os.path.join(self.workplace, 'contract_Test_2024-01-01_signed.pdf')
+        
+        self.handler.on_moved(FileMovedEvent(tmp_file, test_file))
+        
+        self.assertEqual(self.stability_checker.calls, [])
+        self.assertEqual(len(self.mover.calls), 1)
+        self.assertEqual(self.mover.calls[0][0], Path(test_file))
+
+    def test_close_event_skips_stability_polling(self):
+        """Test that a close-after-write event ends the wait for the writer."""
+        from watchdog.events import FileCreatedEvent, FileClosedEvent
+        test_file = os.path.join(self.workplace, 'contract_Test_2024-01-01_signed.pdf')
+        Path(test_file).write_text("PDF content")
+
+        handler = PDFWatchHandler(self.mover, self.stability_checker, debounce_seconds=0.05,
+                                  close_events=True)
+        self.addCleanup(handler.stop)
+        handler._schedule = lambda filepath, renamed_from=None: None
+        handler.on_created(FileCreatedEvent(test_file))
+        handler.on_closed(FileClosedEvent(test_file))
+        handler._process_file(test_file)
+
+        self.assertEqual(self.stability_checker.calls, [])
+        self.assertEqual(len(self.mover.calls), 1)
+
+    def test_close_events_need_debouncing(self):
+        """Test that close waits are never set up on the dispatcher thread."""
+        with patch('signed_watcher.CLOSE_EVENTS_SUPPORTED', True):
+            self.assertFalse(PDFWatchHandler(self.mover, self.stability_checker).close_events)
+        with self.assertRaises(ValueError):
+            PDFWatchHandler(self.mover, self.stability_checker, close_events=True)
+
+    def test_close_entry_dropped_on_move_and_delete(self):
+        """Test that a created file renamed or deleted before processing leaves no entry."""
+        from watchdog.events import FileCreatedEvent, FileDeletedEvent, FileMovedEvent
+        handler = PDFWatchHandler(self.mover, self.stability_checker, debounce_seconds=5.0,
+                                  close_events=True)
+        self.addCleanup(handler.stop)
+        moved = os.path.join(self.workplace, 'contract_Moved_2024-01-01_signed.pdf')
+        deleted = os.path.join(self.workplace, 'contract_Deleted_2024-01-01_signed.pdf')
+        
+        handler.on_created(FileCreatedEvent(moved))
+        handler.on_created(FileCreatedEvent(deleted))
+        handler.on_moved(FileMovedEvent(moved, moved + '.bak'))
+        handler.on_deleted(FileDeletedEvent(deleted))
+        
+        self.assertEqual(handler._closed, {})
+        self.assertEqual(handler._pending, {})
+
+    def test_debounce_collapses_repeated_events(self):
+        """Test that a burst of events for one file is processed once."""
+        import time
+        from watchdog.events import FileCreatedEvent, FileMovedEvent
+        handler = PDFWatchHandler(self.mover, self.stability_checker, debounce_seconds=0.05)
+        self.addCleanup(handler.stop)
+        tmp_file = os.path.join(self.workplace, 'contract_Test_2024-01-01_signed.pdf.part.pdf')
+        test_file = os.path.join(self.workplace, 'contract_Test_2024-01-01_signed.pdf')
+
+        handler.on_created(FileCreatedEvent(tmp_file))
+        handler.on_moved(FileMovedEvent(tmp_file, test_file))
+        handler.on_created(FileCreatedEvent(test_file))
+
+        # Nothing runs on the dispatcher thread
+        self.assertEqual(self.mover.calls, [])
+
+        deadline = time.monotonic() + 2.0
+        while not self.mover.calls and time.monotonic() < deadline:
+            time.sleep(0.01)
+        time.sleep(0.1)
+
+        self.assertEqual(len(self.mover.calls), 1)
+        self.assertEqual(self.mover.calls[0][0], Path(test_file))
+
+
+    def test_debounced_files_wait_concurrently(self):
+        """Test that one file's stability wait does not block the next file."""
+        import threading
+        import time
+        from watchdog.events import FileCreatedEvent
+        # Each wait blocks until both files are waiting; serial processing times out
+        barrier = threading.Barrier(2, timeout=2.0)
+        
+        class _BarrierChecker(_FakeStabilityChecker):
+            def wait_for_stability(self, filepath):
+                super().wait_for_stability(filepath)
+                barrier.wait()
+                return True
+        
+        handler = PDFWatchHandler(self.mover, _BarrierChecker(), debounce_seconds=0.01,
+                                  close_events=False)
+        self.addCleanup(handler.stop)
+        for client in ('Alpha', 'Beta'):
+            test_file = os.path.join(self.workplace, f'contract_{client}_2024-01-01_signed.pdf')
+            handler.on_created(FileCreatedEvent(test_file))
+        
+        deadline = time.monotonic() + 3.0
+        while len(self.mover.calls) < 2 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        
+        self.assertEqual(len(self.mover.calls), 2)
+        self.assertFalse(barrier.broken)
+
+    def test_stop_does_not_wait_for_stability(self):
+        """Test that stop() returns while a file is still in its stability wait."""
+        import threading
+        import time
+        from watchdog.events import FileCreatedEvent
+        waiting, release = threading.Event(), threading.Event()
+        self.addCleanup(release.set)
+        
+        class _BlockingChecker(_FakeStabilityChecker):
+            def wait_for_stability(self, filepath):
+                waiting.set()
+                release.wait(5.0)
+                return False
+        
+        handler = PDFWatchHandler(self.mover, _BlockingChecker(), debounce_seconds=0.01,
+                                  close_events=False)
+        test_file = os.path.join(self.workplace, 'contract_Test_2024-01-01_signed.pdf')
+        handler.on_created(FileCreatedEvent(test_file))
+        self.assertTrue(waiting.wait(2.0))
+        
+        started = time.monotonic()
+        handler.stop()
+        self.assertLess(time.monotonic() - started, 1.0)
+
+
+class TestIsNetworkMount(unittest.TestCase):
+    """Test cases for is_network_mount."""
+    
+    def setUp(self):
+        """Set up a fake mount table."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.mounts = os.path.join(self.temp_dir, 'mounts')
+        with open(self.mounts, 'w') as f:
+            f.write('/dev/sda1 / ext4 rw 0 0\n')
+            f.write('server:/share /mnt/office\\040docs nfs4 rw 0 0\n')
+    
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_local_path(self):
+        """Test that a path on a local mount is not reported as network."""
+        self.assertFalse(is_network_mount(Path('/home/user/workplace'), self.mounts))
+    
+    def test_network_path(self):
+        """Test that the longest matching mount decides, with escaped names."""
+        self.assertTrue(is_network_mount(Path('/mnt/office docs/workplace'), self.mounts))
+        self.assertFalse(is_network_mount(Path('/mnt/office'), self.mounts))
+    
+    def test_missing_mount_table(self):
+        """Test that platforms without a mount table report False."""
+        self.assertFalse(is_network_mount(Path('/'), os.path.join(self.temp_dir, 'none')))
 
 
 if __name__ == '__main__':
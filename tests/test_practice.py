@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Unit tests for practice.py.
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from practice import FileStabilityChecker
+
+
+class TestFileStabilityChecker(unittest.TestCase):
+    """Test cases for FileStabilityChecker class."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.test_file = Path(self.temp_dir) / 'contract_Test_2024-01-01_signed.pdf'
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        shutil.rmtree(self.temp_dir)
+
+    def test_writer_pause_is_not_stable(self):
+        """Test that a ~100ms pause in the writer does not end the wait."""
+        checker = FileStabilityChecker(timeout=10.0, check_interval=0.5)
+        self.test_file.write_bytes(b'%PDF-1.4 first half')
+        writer_done = threading.Event()
+
+        def writer():
+            time.sleep(0.1)
+            with open(self.test_file, 'ab') as f:
+                f.write(b' second half')
+            writer_done.set()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        self.addCleanup(thread.join)
+
+        self.assertTrue(checker.wait_for_stability(self.test_file))
+        # Stable may only be reported after the writer has finished
+        self.assertTrue(writer_done.is_set())
+        self.assertEqual(self.test_file.read_bytes(), b'%PDF-1.4 first half second half')
+
+    def test_missing_file_is_not_stable(self):
+        """Test that a file that does not exist is reported at once."""
+        checker = FileStabilityChecker(timeout=10.0, check_interval=0.5)
+        self.assertFalse(checker.wait_for_stability(self.test_file))
+
+
+if __name__ == '__main__':
+    unittest.main()